@@ -38,6 +38,14 @@ class Notifier(QObject):
         status = "AÇIK" if enabled else "KAPALI"
         print(f"Ayaklı Saat özelliği: {status}")
 
+    def schedule_alarm(self, *_):
+        """
+        Alarmı bir sonraki event loop turunda çal.
+        Timer bitişindeki UI güncellemeleri ses başlatmayı beklemez. QSoundEffect
+        GUI thread'ine bağlı bir QObject olduğu için çalma işi bu thread'de kalır.
+        """
+        QTimer.singleShot(0, self.play_alarm)
+
     def play_alarm(self):
         print(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] ===ALARM RING!===")
         if self.alarm_sound.source().isValid():
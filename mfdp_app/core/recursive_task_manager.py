@@ -6,7 +6,8 @@ from typing import Optional, List
 from mfdp_app.models.data_models import Task
 from mfdp_app.db_manager import (
     insert_task, update_task, get_task_by_id,
-    get_root_tasks, get_child_tasks, get_all_subtasks_recursive
+    get_root_tasks, get_child_tasks, get_all_subtasks_recursive,
+    get_all_tasks_flat
 )
 
 
@@ -21,6 +22,7 @@ class RecursiveTaskManager(QObject):
     task_updated_signal = Signal(int)  # task_id
     task_completed_signal = Signal(int)  # task_id
     task_uncompleted_signal = Signal(int)  # task_id
+    task_states_changed_signal = Signal(list)  # tamamlanma durumu değişen task_id'ler
     
     def __init__(self):
         super().__init__()
@@ -89,7 +91,10 @@ class RecursiveTaskManager(QObject):
                         self.task_completed_signal.emit(tid)
                     else:
                         self.task_uncompleted_signal.emit(tid)
-                    self.task_updated_signal.emit(tid)
+            
+            # Sadece tamamlanma durumu değişti - UI tüm ağacı yeniden kurmak yerine
+            # ilgili satırları yerinde güncelleyebilir
+            self.task_states_changed_signal.emit(list(updated_task_ids))
         
         return success
     
@@ -159,6 +164,10 @@ class RecursiveTaskManager(QObject):
         """Bir görevin doğrudan alt görevlerini getir."""
         return get_child_tasks(parent_id)
     
+    def get_all_tasks_flat(self) -> List[Task]:
+        """Tüm aktif görevleri tek sorguda, düz liste olarak getir."""
+        return get_all_tasks_flat()
+    
     def get_all_tasks_hierarchical(self) -> List[Task]:
         """
         Tüm görevleri hiyerarşik yapıda getir.
@@ -1,10 +1,11 @@
 from PySide6.QtCore import QObject, Signal
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict
 from mfdp_app.models.data_models import Task
 from mfdp_app.db_manager import (
     insert_task, update_task, delete_task, get_task_by_id,
     get_all_tasks, get_tasks_by_tag, get_all_tags,
-    assign_color_to_tag, get_tag_time_summary, get_task_time_summary
+    assign_color_to_tag, get_tag_time_summary, get_task_time_summary,
+    get_task_version
 )
 
 class TaskManager(QObject):
@@ -22,6 +23,10 @@ class TaskManager(QObject):
             '#cba6f7', '#fab387', '#94e2d5', '#f5c2e7'
         ]
         self._color_index = 0
+        # Tag -> aktif tasklar (get_all_tasks sırasıyla). Her task yazması db'deki task
+        # versiyonunu artırır; versiyon değişince bir sonraki okumada yeniden yüklenir.
+        self._tasks_by_tag: Optional[Dict[str, List[Task]]] = None
+        self._tasks_version = -1
     
     def create_task(self, name: str, tag: str, planned_duration_minutes: Optional[int] = None, color: Optional[str] = None) -> Optional[int]:
         """Yeni task oluştur."""
@@ -62,6 +67,16 @@ class TaskManager(QObject):
         """Tüm taskları getir."""
         return get_all_tasks(include_inactive)
     
+    def get_tasks_grouped(self) -> Dict[str, List[Task]]:
+        """Aktif taskları tag'a göre gruplanmış getir (kopya; çağıran değiştirebilir)."""
+        if self._tasks_by_tag is None or self._tasks_version != get_task_version():
+            self._tasks_version = get_task_version()
+            tasks_by_tag = {}
+            for task in get_all_tasks():
+                tasks_by_tag.setdefault(task.tag, []).append(task)
+            self._tasks_by_tag = tasks_by_tag
+        return {tag: list(tasks) for tag, tasks in self._tasks_by_tag.items()}
+    
     def get_tasks_by_tag(self, tag: str) -> List[Task]:
         """Tag'a göre taskları getir."""
         return get_tasks_by_tag(tag)
@@ -1,8 +1,27 @@
 import sqlite3
 import datetime
+import functools
+import numpy as np
 
 DB_NAME = 'focus_tracker.db'
 
+# Tag listesi nadiren değişir; her refresh'te DB'ye gitmemek için bellekte tutulur.
+# Tag yazan fonksiyonlar cache'i geçersiz kılar ve versiyonu artırır.
+_tag_cache = None
+_tag_cache_version = 0
+
+# Task listesi versiyonu: tasks tablosuna her yazmada artar (TaskManager'ın gruplama cache'i için).
+_task_version = 0
+
+# İstatistik verisi versiyonu: session veya tag yazıldığında artar (stats cache anahtarı).
+_data_version = 0
+
+# Salt okunur istatistik sorgularının sonuçları: (fonksiyon, argümanlar) -> sonuç.
+# Sadece _stats_memo_stamp'teki (veri versiyonu, gün) için geçerlidir; damga değişince
+# ilk kayıtta temizlenir. Yazma yolunda bust_stats_cache() ile de temizlenir.
+_stats_memo = {}
+_stats_memo_stamp = None
+
 def create_connection():
     try:
         conn = sqlite3.connect(DB_NAME, check_same_thread=False)
@@ -111,12 +130,54 @@ def log_session_v2(start_time, end_time, duration_sec, planned_min, mode, comple
                 duration_sec, planned_min, mode, completed, task_name, category, interruption_count
             ))
             conn.commit()
+            bump_data_version()
             print(f"💾 V2 KAYIT: {mode} ({duration_sec} sn, {interruption_count} kesinti)")
         except sqlite3.Error as e:
             print(f"Kayıt hatası: {e}")
         finally:
             conn.close()
 
+def bump_data_version():
+    """İstatistikleri etkileyen bir yazma sonrası veri versiyonunu artır."""
+    global _data_version
+    _data_version += 1
+    bust_stats_cache()
+
+def bust_stats_cache():
+    """Bellekteki istatistik sorgu sonuçlarını temizle."""
+    _stats_memo.clear()
+
+def _memoize_stats(func):
+    """
+    İstatistik sorgusunun sonucunu yazma olana kadar bellekte tut.
+    Sonuç (veri versiyonu, bugünün tarihi) damgasıyla saklanır; 'son X gün' sorguları
+    gün değişince yeniden çalışır, eski günlerin sonuçları birikmez.
+    Dönen liste/dict paylaşılır, çağıran değiştirmemeli.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        global _stats_memo_stamp
+        # Sorgudan önce alınır; sorgu sürerken yazma olursa sonuç saklanmaz
+        stamp = (_data_version, datetime.date.today())
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        if _stats_memo_stamp == stamp:
+            try:
+                return _stats_memo[key]
+            except KeyError:
+                pass
+        result = func(*args, **kwargs)
+        if _data_version == stamp[0]:
+            if _stats_memo_stamp != stamp:
+                _stats_memo.clear()
+                _stats_memo_stamp = stamp
+            _stats_memo[key] = result
+        return result
+    return wrapper
+
+def get_data_version():
+    """İstatistik verisi versiyonu - değişmediyse cache'lenmiş sonuçlar kullanılabilir."""
+    return _data_version
+
 # --- AYAR FONKSİYONLARI ---
 def load_settings():
     conn = create_connection()
@@ -139,11 +200,36 @@ def save_setting(key, value):
         conn.commit()
         conn.close()
 
+def save_settings(settings):
+    """Birden fazla ayarı tek bağlantı ve tek transaction ile kaydet."""
+    conn = create_connection()
+    if conn:
+        try:
+            cursor = conn.cursor()
+            cursor.executemany(
+                "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                [(key, str(value)) for key, value in settings.items()]
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            print(f"Ayar kayıt hatası: {e}")
+        finally:
+            conn.close()
+
 # --- ANALİZ FONKSİYONLARI (Grafikler İçin) ---
+def _last_n_dates(days):
+    """Bugün dahil son X günün tarihleri, eskiden yeniye."""
+    today = datetime.date.today()
+    return [today - datetime.timedelta(days=i) for i in range(days - 1, -1, -1)]
+
+@_memoize_stats
 def get_daily_trend_v2(days=7):
-    """Son X günün verileri (sadece Focus ve Free Timer modları)."""
+    """
+    Son X günün verileri (sadece Focus ve Free Timer modları).
+    Dönüş: (gün etiketleri dizisi, dakika dizisi int32) - eskiden yeniye.
+    """
     conn = create_connection()
-    data = []
+    labels, minutes = np.array([], dtype=str), np.zeros(0, dtype=np.int32)
     if conn:
         try:
             cursor = conn.cursor()
@@ -158,22 +244,22 @@ def get_daily_trend_v2(days=7):
             """
             cursor.execute(query, (f'-{days-1} days',))
             rows = cursor.fetchall()
-            db_data = {row['day']: row['minutes'] for row in rows}
-            
-            for i in range(days - 1, -1, -1):
-                date_calc = datetime.date.today() - datetime.timedelta(days=i)
-                date_str = date_calc.strftime('%Y-%m-%d')
-                minutes = db_data.get(date_str, 0)
-                display_date = date_calc.strftime('%d %b')
-                data.append((display_date, minutes))
+            # Tüm günler önceden 0 ile doldurulur, eksik gün için .get(..., 0) gerekmez
+            dates = _last_n_dates(days)
+            day_keys = [d.strftime('%Y-%m-%d') for d in dates]
+            db_data = dict.fromkeys(day_keys, 0)
+            db_data.update((row['day'], row['minutes']) for row in rows)
+            labels = np.array([d.strftime('%d %b') for d in dates])
+            minutes = np.fromiter((db_data[key] for key in day_keys), dtype=np.int32, count=len(day_keys))
         except: pass
         finally: conn.close()
-    return data
+    return labels, minutes
 
+@_memoize_stats
 def get_hourly_productivity_v2():
-    """Saatlik verimlilik (sadece Focus ve Free Timer modları)."""
+    """Saatlik verimlilik (sadece Focus ve Free Timer modları). Dönüş: 24 elemanlı int32 dizi."""
     conn = create_connection()
-    hours_data = [0] * 24
+    hours_data = np.zeros(24, dtype=np.int32)
     if conn:
         try:
             cursor = conn.cursor()
@@ -186,12 +272,14 @@ def get_hourly_productivity_v2():
             """
             cursor.execute(query)
             rows = cursor.fetchall()
-            for row in rows:
-                hours_data[int(row['hour'])] = int(row['minutes'])
+            if rows:
+                hours = np.fromiter((int(row['hour']) for row in rows), dtype=np.intp, count=len(rows))
+                hours_data[hours] = np.fromiter((row['minutes'] for row in rows), dtype=np.int32, count=len(rows))
         except: pass
         finally: conn.close()
     return hours_data
 
+@_memoize_stats
 def get_completion_rate_v2():
     """Tamamlama oranı (sadece Focus ve Free Timer modları)."""
     conn = create_connection()
@@ -216,6 +304,7 @@ def get_completion_rate_v2():
 
 # mfdp_app/db_manager.py (En alta ekle)
 
+@_memoize_stats
 def get_focus_quality_stats():
     """
     Oturumları kesinti sayısına göre gruplar (sadece Focus ve Free Timer modları).
@@ -264,15 +353,16 @@ def insert_task(name, tag, planned_duration_minutes=None, color=None, parent_id=
             """, (name, tag, planned_duration_minutes, created_at, color, parent_id, is_completed))
             task_id = cursor.lastrowid
             conn.commit()
+            bump_task_version()
             
-            # Tag yoksa oluştur
-            cursor.execute("SELECT name FROM tags WHERE name = ?", (tag,))
-            if not cursor.fetchone():
-                cursor.execute("""
-                    INSERT INTO tags (name, color, created_at)
-                    VALUES (?, ?, ?)
-                """, (tag, color, created_at))
+            # Tag yoksa oluştur (name PRIMARY KEY; varsa satır eklenmez)
+            cursor.execute("""
+                INSERT OR IGNORE INTO tags (name, color, created_at)
+                VALUES (?, ?, ?)
+            """, (tag, color, created_at))
+            if cursor.rowcount:
                 conn.commit()
+                invalidate_tag_cache()
             
             return task_id
         except sqlite3.IntegrityError:
@@ -320,6 +410,7 @@ def update_task(task_id, name=None, tag=None, planned_duration_minutes=None, col
                 query = f"UPDATE tasks SET {', '.join(updates)} WHERE id = ?"
                 cursor.execute(query, params)
                 conn.commit()
+                bump_task_version()
                 return True
         except sqlite3.Error as e:
             print(f"Task güncelleme hatası: {e}")
@@ -328,6 +419,15 @@ def update_task(task_id, name=None, tag=None, planned_duration_minutes=None, col
             conn.close()
     return False
 
+def bump_task_version():
+    """tasks tablosuna yazıldıktan sonra task versiyonunu artır."""
+    global _task_version
+    _task_version += 1
+
+def get_task_version():
+    """Task versiyonu - task listesi cache'lerinin bayatlığını anlamak için."""
+    return _task_version
+
 def get_task_by_id(task_id):
     """ID'ye göre task getir."""
     conn = create_connection()
@@ -419,8 +519,23 @@ def delete_task(task_id):
     return update_task(task_id, is_active=False)
 
 # --- TAG FONKSİYONLARI ---
+def invalidate_tag_cache():
+    """Tag cache'ini geçersiz kıl (tag oluşturma/güncelleme sonrası)."""
+    global _tag_cache, _tag_cache_version
+    _tag_cache = None
+    _tag_cache_version += 1
+    bump_data_version()
+
+def get_tag_cache_version():
+    """Tag cache versiyonu - UI'ın gereksiz yeniden çizimleri atlaması için."""
+    return _tag_cache_version
+
 def get_all_tags():
-    """Tüm tagları getir."""
+    """Tüm tagları getir (bellekteki cache'ten)."""
+    global _tag_cache
+    if _tag_cache is not None:
+        return list(_tag_cache)
+    
     conn = create_connection()
     tags = []
     if conn:
@@ -432,11 +547,12 @@ def get_all_tags():
                     'name': row['name'],
                     'color': row['color']
                 })
+            _tag_cache = tags
         except Exception as e:
             print(f"Tag listesi getirme hatası: {e}")
         finally:
             conn.close()
-    return tags
+    return list(tags)
 
 def assign_color_to_tag(tag, color):
     """Tag'a renk ata."""
@@ -444,17 +560,18 @@ def assign_color_to_tag(tag, color):
     if conn:
         try:
             cursor = conn.cursor()
-            # Tag var mı kontrol et
-            cursor.execute("SELECT name FROM tags WHERE name = ?", (tag,))
-            if cursor.fetchone():
-                cursor.execute("UPDATE tags SET color = ? WHERE name = ?", (color, tag))
-            else:
-                created_at = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                cursor.execute("INSERT INTO tags (name, color, created_at) VALUES (?, ?, ?)", (tag, color, created_at))
+            # Tag yoksa ekle, varsa sadece rengini güncelle
+            created_at = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            cursor.execute("""
+                INSERT INTO tags (name, color, created_at) VALUES (?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET color = excluded.color
+            """, (tag, color, created_at))
             
             # Task'lardaki tag renklerini de güncelle
             cursor.execute("UPDATE tasks SET color = ? WHERE tag = ?", (color, tag))
             conn.commit()
+            bump_task_version()  # Task.color değişti; task cache'leri yeniden yüklensin
+            invalidate_tag_cache()
             return True
         except sqlite3.Error as e:
             print(f"Tag renk atama hatası: {e}")
@@ -463,6 +580,7 @@ def assign_color_to_tag(tag, color):
             conn.close()
     return False
 
+@_memoize_stats
 def get_tag_time_summary(tag, days=None):
     """Tag için toplam süre (dakika) - sadece Focus ve Free Timer modları."""
     conn = create_connection()
@@ -534,6 +652,7 @@ def get_task_time_summary(task_id, days=None):
             conn.close()
     return 0.0
 
+@_memoize_stats
 def get_daily_trend_by_tag(tag, days=7):
     """Tag bazlı günlük trend (sadece Focus ve Free Timer modları)."""
     conn = create_connection()
@@ -553,18 +672,80 @@ def get_daily_trend_by_tag(tag, days=7):
             """
             cursor.execute(query, (tag, f'-{days-1} days'))
             rows = cursor.fetchall()
-            db_data = {row['day']: row['minutes'] for row in rows}
-            
-            for i in range(days - 1, -1, -1):
-                date_calc = datetime.date.today() - datetime.timedelta(days=i)
-                date_str = date_calc.strftime('%Y-%m-%d')
-                minutes = db_data.get(date_str, 0)
-                display_date = date_calc.strftime('%d %b')
-                data.append((display_date, minutes))
+            # Tüm günler önceden 0 ile doldurulur, eksik gün için .get(..., 0) gerekmez
+            dates = _last_n_dates(days)
+            day_keys = [d.strftime('%Y-%m-%d') for d in dates]
+            db_data = dict.fromkeys(day_keys, 0)
+            db_data.update((row['day'], row['minutes']) for row in rows)
+            data = [(d.strftime('%d %b'), db_data[key]) for d, key in zip(dates, day_keys)]
         except: pass
         finally: conn.close()
     return data
 
+def get_day_labels(days=7):
+    """Son X günün grafik etiketleri ('%d %b'), eskiden yeniye."""
+    return [d.strftime('%d %b') for d in _last_n_dates(days)]
+
+@_memoize_stats
+def get_daily_trend_all_tags(days=7):
+    """
+    Tüm tag'ler için günlük trend tek sorguda (sadece Focus ve Free Timer modları).
+    Dönüş: [(gün etiketi, tag, dakika), ...] - sadece verisi olan günler.
+    """
+    conn = create_connection()
+    data = []
+    if conn:
+        try:
+            cursor = conn.cursor()
+            query = """
+                SELECT strftime('%Y-%m-%d', start_time) as day,
+                       category as tag,
+                       SUM(duration_seconds) / 60 as minutes
+                FROM sessions_v2
+                WHERE category IS NOT NULL
+                AND (mode = 'Focus' OR mode = 'Free Timer')
+                AND start_time >= date('now', ?, 'localtime')
+                GROUP BY day, category
+                ORDER BY day ASC
+            """
+            cursor.execute(query, (f'-{days-1} days',))
+            for row in cursor.fetchall():
+                display_date = datetime.datetime.strptime(row['day'], '%Y-%m-%d').strftime('%d %b')
+                data.append((display_date, row['tag'], row['minutes']))
+        except Exception as e:
+            print(f"Tag trend hatası: {e}")
+        finally:
+            conn.close()
+    return data
+
+@_memoize_stats
+def get_all_tag_time_summary(days=None):
+    """Tüm tag'ler için toplam süre (dakika) tek sorguda. Dönüş: [(tag, dakika), ...]"""
+    conn = create_connection()
+    data = []
+    if conn:
+        try:
+            cursor = conn.cursor()
+            query = """
+                SELECT category as tag, SUM(duration_seconds) / 60.0 as total_minutes
+                FROM sessions_v2
+                WHERE category IS NOT NULL
+                AND (mode = 'Focus' OR mode = 'Free Timer')
+            """
+            params = ()
+            if days:
+                query += " AND start_time >= date('now', ?, 'localtime')"
+                params = (f'-{days} days',)
+            query += " GROUP BY category"
+            cursor.execute(query, params)
+            for row in cursor.fetchall():
+                data.append((row['tag'], row['total_minutes'] or 0.0))
+        except Exception as e:
+            print(f"Tag süre özeti hatası: {e}")
+        finally:
+            conn.close()
+    return data
+
 # --- RECURSIVE TASK FONKSİYONLARI ---
 def get_child_tasks(parent_id):
     """Bir task'ın alt görevlerini getir."""
@@ -622,6 +803,34 @@ def get_root_tasks():
             conn.close()
     return tasks
 
+def get_all_tasks_flat():
+    """Tüm aktif görevleri tek sorguda getir (hiyerarşi client tarafında kurulur)."""
+    conn = create_connection()
+    tasks = []
+    if conn:
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM tasks WHERE is_active = 1 ORDER BY created_at ASC, id ASC")
+            
+            from mfdp_app.models.data_models import Task
+            for row in cursor.fetchall():
+                tasks.append(Task(
+                    id=row['id'],
+                    name=row['name'],
+                    tag=row['tag'],
+                    planned_duration_minutes=row['planned_duration_minutes'],
+                    created_at=datetime.datetime.strptime(row['created_at'], '%Y-%m-%d %H:%M:%S'),
+                    is_active=bool(row['is_active']),
+                    color=row['color'],
+                    parent_id=row['parent_id'] if row['parent_id'] else None,
+                    is_completed=bool(row['is_completed']) if row['is_completed'] is not None else False
+                ))
+        except Exception as e:
+            print(f"Görev listesi getirme hatası: {e}")
+        finally:
+            conn.close()
+    return tasks
+
 def get_all_subtasks_recursive(task_id):
     """Bir task'ın tüm alt görevlerini recursive olarak getir."""
     all_subtasks = []
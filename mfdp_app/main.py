@@ -1,5 +1,6 @@
 import sys
 import os
+import threading
 from mfdp_app.ui.styles import MODERN_DARK_THEME
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import qInstallMessageHandler
@@ -13,6 +14,14 @@ def message_handler(msg_type, context, message):
     if any(keyword in msg_lower for keyword in ['ffmpeg', 'vdpau', 'libvdpau']):
         return  # Bu mesajları görmezden gel
 
+def warm_up_matplotlib():
+    """Font cache'ini ve Agg yazı çizimini önceden ısıt (istatistik penceresi ilk açılışta beklemesin)."""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    fig = Figure(figsize=(1, 1))
+    fig.text(0.5, 0.5, "0")
+    FigureCanvasAgg(fig).draw()
+
 def main():
     # Qt Multimedia uyarılarını bastır
     os.environ.setdefault('QT_LOGGING_RULES', 'qt.multimedia.*=false')
@@ -31,6 +40,9 @@ def main():
     
     window = MainWindow()
     window.show()
+
+    # 3. Grafik font cache'ini arka planda hazırla
+    threading.Thread(target=warm_up_matplotlib, daemon=True).start()
     
     sys.exit(app.exec())
 
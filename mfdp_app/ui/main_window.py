@@ -1,6 +1,6 @@
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, 
                                QLabel, QPushButton, QHBoxLayout, QCheckBox)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot
 from PySide6.QtGui import QCloseEvent
 from mfdp_app.core.notifier import Notifier
 from mfdp_app.core.timer import PmdrCountdownTimer, CountUpTimer
@@ -25,6 +25,7 @@ class MainWindow(QMainWindow):
         self.recursive_task_window = None
         self.task_window = None
         self.stats_window = None
+        self.settings_dialog = None
         
         # Timer modu ve instance'ları
         self.timer_mode = "countdown"  # "countdown" veya "countup"
@@ -38,13 +39,13 @@ class MainWindow(QMainWindow):
         self.timer_logic_countdown.timeout_signal.connect(self.update_timer_label)
         self.timer_logic_countdown.state_changed_signal.connect(self.update_status_label)
         self.timer_logic_countdown.finished_signal.connect(self.on_timer_finished)
-        self.timer_logic_countdown.finished_signal.connect(self.notifier.play_alarm)
+        self.timer_logic_countdown.finished_signal.connect(self.notifier.schedule_alarm)
         self.timer_logic_countdown.task_changed_signal.connect(self.on_task_changed)
         
         # Countup timer signal'leri
         self.timer_logic_countup.timeout_signal.connect(self.update_timer_label_countup)
         self.timer_logic_countup.finished_signal.connect(self.on_timer_finished_countup)
-        self.timer_logic_countup.finished_signal.connect(self.notifier.play_alarm)
+        self.timer_logic_countup.finished_signal.connect(self.notifier.schedule_alarm)
         self.timer_logic_countup.task_changed_signal.connect(self.on_task_changed)
 
         self.init_ui()
@@ -210,7 +211,8 @@ class MainWindow(QMainWindow):
             btn = QPushButton(btn_text)
             btn.setObjectName("ModeButton")
             btn.setCursor(Qt.PointingHandCursor)
-            btn.clicked.connect(lambda checked, m=mode_key: self.timer_logic_countdown.set_mode(m))
+            btn.setProperty("mode_key", mode_key)
+            btn.clicked.connect(self._on_mode_clicked)
             self.mode_buttons.append(btn)
             self.mode_layout.addWidget(btn)
         main_layout.addLayout(self.mode_layout)
@@ -332,6 +334,11 @@ class MainWindow(QMainWindow):
             self.timer_logic = self.timer_logic_countdown
             self.timer_logic_countdown.reset()
     
+    @Slot()
+    def _on_mode_clicked(self):
+        """Mola/Focus butonları için ortak slot - modu tıklanan butondan okur."""
+        self.timer_logic_countdown.set_mode(self.sender().property("mode_key"))
+
     def toggle_timer(self):
         """Başlat/Duraklat butonu mantığına DND kontrolü ekle (countdown için)."""
         is_running = self.timer_logic_countdown.start_stop()
@@ -364,8 +371,12 @@ class MainWindow(QMainWindow):
         self.btn_start_countup.setText("Başlat")
         self.lbl_timer_countup.setText("00:00")
     
+    @Slot(str)
     def update_timer_label_countup(self, time_str):
         """Count-up timer label'ını güncelle."""
+        # Metin aynıysa setText (ve tetiklediği repaint) gereksiz
+        if self.lbl_timer_countup.text() == time_str:
+            return
         self.lbl_timer_countup.setText(time_str)
     
     def on_timer_finished_countup(self, finished_mode):
@@ -373,11 +384,17 @@ class MainWindow(QMainWindow):
         self.lbl_status_countup.setText("Tamamlandı!")
         self.btn_start_countup.setText("Başlat")
             
+    @Slot(str)
     def update_timer_label(self, time_str):
+        # Metin aynıysa setText (ve tetiklediği repaint) gereksiz
+        if self.lbl_timer.text() == time_str:
+            return
         self.lbl_timer.setText(time_str)
 
+    @Slot(str)
     def update_status_label(self, mode):
-        self.lbl_status.setText(mode)
+        if self.lbl_status.text() != mode:
+            self.lbl_status.setText(mode)
         self.btn_start.setText("Başlat")
 
     def on_timer_finished(self, finished_mode):
@@ -450,18 +467,25 @@ class MainWindow(QMainWindow):
         self.timer_logic.set_task(task_id)
     
     def open_settings(self):
-        dialog = SettingsDialog(self)
-        if dialog.exec(): 
+        # Dialog'u bir kez oluştur, her açılışta sadece değerleri yeniden yükle
+        if self.settings_dialog is None:
+            self.settings_dialog = SettingsDialog(self)
+        self.settings_dialog.load_current_values()
+        if self.settings_dialog.exec(): 
             self.timer_logic.reload_settings()
             if not self.timer_logic.is_running:
                 self.timer_logic.reset()
 
     def open_stats(self):
         """İstatistik penceresini aç."""
-        if self.stats_window is None or not self.stats_window.isVisible():
+        if self.stats_window is None:
             self.stats_window = StatsWindow(self)
             self.stats_window.setModal(False)  # Non-modal yap
             self.stats_window.show()
+        elif not self.stats_window.isVisible():
+            # Pencereyi yeniden kullan, sadece verileri tazele
+            self.stats_window.refresh()
+            self.stats_window.show()
         else:
             # Zaten açıksa öne getir
             self.stats_window.raise_()
@@ -469,8 +493,11 @@ class MainWindow(QMainWindow):
     
     def open_recursive_tasks(self):
         """Özyinelemeli görev yönetim penceresini aç."""
-        if self.recursive_task_window is None or not self.recursive_task_window.isVisible():
+        # Pencereyi bir kez oluştur; her açılışta yenisini yaratmak eski instance'ları
+        # (ve signal bağlantılarını) parent altında biriktiriyordu
+        if self.recursive_task_window is None:
             self.recursive_task_window = RecursiveTaskWindow(self)
+        if not self.recursive_task_window.isVisible():
             # setModal(False) zaten __init__ içinde yapılıyor
             self.recursive_task_window.show()
         else:
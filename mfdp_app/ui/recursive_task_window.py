@@ -4,14 +4,104 @@ QTreeWidget ile checkbox'lar ve hierarchical görünüm
 """
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QPushButton, QTreeWidget, QTreeWidgetItem, QFormLayout,
+    QPushButton, QTreeWidget, QTreeWidgetItem, QTreeWidgetItemIterator, QFormLayout,
     QSpinBox, QMessageBox, QGroupBox, QComboBox
 )
 from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QColor, QKeyEvent
+from PySide6.QtGui import QBrush, QColor, QKeyEvent, QShowEvent, QHideEvent
 from mfdp_app.core.recursive_task_manager import RecursiveTaskManager
 from mfdp_app.models.data_models import Task
-from mfdp_app.db_manager import get_all_tags
+from mfdp_app.db_manager import get_all_tags, get_tag_cache_version
+
+
+# Alt görevleri henüz oluşturulmamış (kapalı) dallar için item flag'i:
+# False = yüklenmedi (placeholder var), True = ilk açılışta yüklendi
+LAZY_LOADED_ROLE = Qt.UserRole + 1
+
+
+# Pencerenin tüm stili tek QSS'te - Qt tek seferde parse edip selector ile uygular
+RECURSIVE_TASK_WINDOW_QSS = """
+* {
+    background-color: #1e1e2e;
+    color: #cdd6f4;
+}
+
+QLabel#WindowTitle {
+    font-size: 24px;
+    font-weight: bold;
+    color: #a6e3a1;
+    padding: 10px;
+}
+
+QLabel#InfoLabel {
+    color: #bac2de;
+    font-size: 11px;
+    padding: 5px;
+    background-color: #313244;
+    border-radius: 5px;
+}
+
+QGroupBox {
+    font-weight: bold;
+    border: 1px solid #45475a;
+    border-radius: 5px;
+    margin-top: 30px;
+    padding-top: 30px;
+}
+
+QTreeWidget {
+    background-color: #313244;
+    border: 1px solid #45475a;
+    border-radius: 5px;
+    color: #cdd6f4;
+}
+QTreeWidget::item {
+    padding: 5px;
+    height: 25px;
+}
+QTreeWidget::item:selected {
+    background-color: #45475a;
+}
+QTreeWidget::item:hover {
+    background-color: #585b70;
+}
+
+QLineEdit#FormInput, QComboBox#FormInput, QSpinBox#FormInput {
+    background-color: #313244;
+    border: 1px solid #45475a;
+    border-radius: 5px;
+    padding: 5px;
+}
+
+QPushButton#AddSubtaskButton {
+    background-color: #89b4fa;
+    color: #1e1e2e;
+    font-weight: bold;
+    padding: 8px;
+}
+QPushButton#SaveButton {
+    background-color: #a6e3a1;
+    color: #1e1e2e;
+    font-weight: bold;
+    padding: 8px;
+}
+QPushButton#DeleteButton {
+    background-color: #f38ba8;
+    color: #1e1e2e;
+    font-weight: bold;
+    padding: 8px;
+}
+QPushButton#ClearButton {
+    background-color: #45475a;
+    color: #cdd6f4;
+    padding: 8px;
+}
+QPushButton#CloseButton {
+    background-color: #45475a;
+    color: #cdd6f4;
+    padding: 8px 20px;
+}
+"""
 
 
 class RecursiveTaskWindow(QDialog):
@@ -22,6 +112,14 @@ class RecursiveTaskWindow(QDialog):
         self.task_manager = RecursiveTaskManager()
         self.editing_task_id = None
         self._updating_tree = False  # Tree güncelleme flag'i
+        self._last_tag_version = None  # Tag combo'nun en son hangi cache versiyonuyla dolduğu
+        self._item_by_id = {}  # task_id -> QTreeWidgetItem (yerinde güncelleme için)
+        self._last_snapshot_hash = None  # Son çizilen görev verisinin hash'i
+        self._depth_cache = {}  # task_id -> derinlik (parent combo doldurulurken)
+        self._path_cache = {}  # task_id -> "Ana > Alt" görünen isim
+        self._children_by_parent = {}  # Son refresh'teki parent_id -> [Task] (lazy dallar için)
+        self._task_by_id = {}  # Son refresh'teki task_id -> Task
+        self._collapsed_ids = set()  # Kullanıcının kapattığı dallar (alt görevleri lazy yüklenir)
         
         # Debounce timer - birden fazla signal geldiğinde tek bir refresh yapmak için
         self._refresh_timer = QTimer()
@@ -30,7 +128,7 @@ class RecursiveTaskWindow(QDialog):
         
         self.setWindowTitle("Özyinelemeli Görev Yönetimi - MFDP")
         self.resize(900, 700)
-        self.setStyleSheet("background-color: #1e1e2e; color: #cdd6f4;")
+        self.setStyleSheet(RECURSIVE_TASK_WINDOW_QSS)
         
         # Non-modal yap - arka plandaki pencereyi kullanılabilir tut
         self.setModal(False)
@@ -42,13 +140,49 @@ class RecursiveTaskWindow(QDialog):
         self.btn_close.setAutoDefault(False)
         
         # TaskManager signal'larını dinle
-        self.task_manager.task_updated_signal.connect(self.schedule_refresh)
-        self.task_manager.task_completed_signal.connect(self.on_task_completed)
-        self.task_manager.task_uncompleted_signal.connect(self.on_task_uncompleted)
+        self._connect_manager_signals()
         
         # İlk yükleme
         self.refresh_task_tree()
     
+    def _manager_connections(self):
+        """Pencerenin dinlediği (signal, slot) çiftleri."""
+        return (
+            (self.task_manager.task_updated_signal, self.schedule_refresh),
+            (self.task_manager.task_completed_signal, self.on_task_completed),
+            (self.task_manager.task_uncompleted_signal, self.on_task_uncompleted),
+            (self.task_manager.task_states_changed_signal, self.on_task_states_changed),
+        )
+    
+    def _connect_manager_signals(self):
+        """Signal'leri bağla - tekrar açılışlarda aynı slot birden fazla bağlanmasın."""
+        for signal, slot in self._manager_connections():
+            try:
+                signal.connect(slot, Qt.UniqueConnection)
+            except RuntimeError:
+                pass  # Zaten bağlı
+    
+    def _disconnect_manager_signals(self):
+        """Pencere gizlenince signal bağlantılarını kaldır."""
+        for signal, slot in self._manager_connections():
+            try:
+                signal.disconnect(slot)
+            except RuntimeError:
+                pass  # Zaten bağlı değil
+    
+    def showEvent(self, event: QShowEvent):
+        """Pencere (yeniden) açıldığında signal'leri bağla ve veriyi tazele."""
+        super().showEvent(event)
+        self._connect_manager_signals()
+        # Başka pencerelerden yapılan değişiklikler için; veri aynıysa rebuild atlanır
+        self.schedule_refresh()
+    
+    def hideEvent(self, event: QHideEvent):
+        """Kapat butonu (accept) closeEvent üretmez; temizlik burada yapılır."""
+        self._refresh_timer.stop()
+        self._disconnect_manager_signals()
+        super().hideEvent(event)
+    
     def init_ui(self):
         """UI bileşenlerini oluştur."""
         main_layout = QVBoxLayout(self)
@@ -57,7 +191,7 @@ class RecursiveTaskWindow(QDialog):
         
         # Başlık
         title = QLabel("Özyinelemeli Görev Yönetimi")
-        title.setStyleSheet("font-size: 24px; font-weight: bold; color: #a6e3a1; padding: 10px;")
+        title.setObjectName("WindowTitle")
         main_layout.addWidget(title)
         
         # Ana içerik: Sol tarafta tree, sağ tarafta form
@@ -65,39 +199,21 @@ class RecursiveTaskWindow(QDialog):
         
         # Sol: Task Tree
         tree_group = QGroupBox("Görevler (Hiyerarşik)")
-        tree_group.setStyleSheet("QGroupBox { font-weight: bold; border: 1px solid #45475a; border-radius: 5px; margin-top: 30px; padding-top: 30px; }")
         tree_layout = QVBoxLayout()
         
         self.task_tree = QTreeWidget()
         self.task_tree.setHeaderLabels(["Görev", "Süre"])
         self.task_tree.setColumnWidth(0, 400)
         self.task_tree.setColumnWidth(1, 100)
-        self.task_tree.setStyleSheet("""
-            QTreeWidget {
-                background-color: #313244;
-                border: 1px solid #45475a;
-                border-radius: 5px;
-                color: #cdd6f4;
-            }
-            QTreeWidget::item {
-                padding: 5px;
-                height: 25px;
-            }
-            QTreeWidget::item:selected {
-                background-color: #45475a;
-            }
-            QTreeWidget::item:hover {
-                background-color: #585b70;
-            }
-        """)
         self.task_tree.itemChanged.connect(self.on_checkbox_changed)
         self.task_tree.itemClicked.connect(self.on_task_selected)
         self.task_tree.itemDoubleClicked.connect(self.on_task_double_clicked)
+        self.task_tree.itemExpanded.connect(self.on_item_expanded)
         tree_layout.addWidget(self.task_tree)
         
         # Alt görev ekleme butonu
         btn_add_subtask = QPushButton("Seçili Görevin Alt Görevi Olarak Ekle")
-        btn_add_subtask.setStyleSheet("background-color: #89b4fa; color: #1e1e2e; font-weight: bold; padding: 8px;")
+        btn_add_subtask.setObjectName("AddSubtaskButton")
         btn_add_subtask.setCursor(Qt.PointingHandCursor)
         btn_add_subtask.clicked.connect(self.add_as_subtask)
         tree_layout.addWidget(btn_add_subtask)
@@ -107,7 +223,6 @@ class RecursiveTaskWindow(QDialog):
         
         # Sağ: Task Formu
         form_group = QGroupBox("Görev Oluştur/Düzenle")
-        form_group.setStyleSheet("QGroupBox { font-weight: bold; border: 1px solid #45475a; border-radius: 5px; margin-top: 30px; padding-top: 30px; }")
         form_layout = QVBoxLayout()
         
         form = QFormLayout()
@@ -115,7 +230,7 @@ class RecursiveTaskWindow(QDialog):
         
         self.input_title = QLineEdit()
         self.input_title.setPlaceholderText("Görev başlığı")
-        self.input_title.setStyleSheet("background-color: #313244; border: 1px solid #45475a; border-radius: 5px; padding: 5px;")
+        self.input_title.setObjectName("FormInput")
         # Enter tuşuna basıldığında kaydet
         self.input_title.returnPressed.connect(self.save_task)
         form.addRow("Başlık:", self.input_title)
@@ -123,7 +238,7 @@ class RecursiveTaskWindow(QDialog):
         # Parent seçimi
         self.combo_parent = QComboBox()
         self.combo_parent.addItem("(Ana Görev)", None)
-        self.combo_parent.setStyleSheet("background-color: #313244; border: 1px solid #45475a; border-radius: 5px; padding: 5px;")
+        self.combo_parent.setObjectName("FormInput")
         form.addRow("Ana Görev:", self.combo_parent)
         
         # Süre seçimi
@@ -133,13 +248,13 @@ class RecursiveTaskWindow(QDialog):
         self.input_duration.setValue(0)
         self.input_duration.setSuffix(" dakika")
         self.input_duration.setSpecialValueText("Süresiz")
-        self.input_duration.setStyleSheet("background-color: #313244; border: 1px solid #45475a; border-radius: 5px; padding: 5px;")
+        self.input_duration.setObjectName("FormInput")
         form.addRow("Planlanan Süre:", self.input_duration)
         
         # Tag seçimi
         self.combo_tag = QComboBox()
         self.combo_tag.setEditable(True)
-        self.combo_tag.setStyleSheet("background-color: #313244; border: 1px solid #45475a; border-radius: 5px; padding: 5px;")
+        self.combo_tag.setObjectName("FormInput")
         form.addRow("Tag:", self.combo_tag)
         
         form_layout.addLayout(form)
@@ -147,7 +262,7 @@ class RecursiveTaskWindow(QDialog):
         # Bilgi etiketi
         info_label = QLabel("💡 İpucu: Tree'de bir göreve çift tıklayarak veya 'Alt Görev Ekle' butonuna basarak alt görev ekleyebilirsiniz.")
         info_label.setWordWrap(True)
-        info_label.setStyleSheet("color: #bac2de; font-size: 11px; padding: 5px; background-color: #313244; border-radius: 5px;")
+        info_label.setObjectName("InfoLabel")
         form_layout.addWidget(info_label)
         
         # Butonlar
@@ -155,19 +270,19 @@ class RecursiveTaskWindow(QDialog):
         btn_layout.setSpacing(10)
         
         self.btn_save = QPushButton("Kaydet")
-        self.btn_save.setStyleSheet("background-color: #a6e3a1; color: #1e1e2e; font-weight: bold; padding: 8px;")
+        self.btn_save.setObjectName("SaveButton")
         self.btn_save.clicked.connect(self.save_task)
         # Enter tuşu için default button yapma - sadece görsel olarak vurgula
         self.btn_save.setAutoDefault(False)
         btn_layout.addWidget(self.btn_save)
         
         self.btn_delete = QPushButton("Sil")
-        self.btn_delete.setStyleSheet("background-color: #f38ba8; color: #1e1e2e; font-weight: bold; padding: 8px;")
+        self.btn_delete.setObjectName("DeleteButton")
         self.btn_delete.clicked.connect(self.delete_task)
         btn_layout.addWidget(self.btn_delete)
         
         self.btn_clear = QPushButton("Temizle")
-        self.btn_clear.setStyleSheet("background-color: #45475a; color: #cdd6f4; padding: 8px;")
+        self.btn_clear.setObjectName("ClearButton")
         self.btn_clear.clicked.connect(self.clear_form)
         btn_layout.addWidget(self.btn_clear)
         
@@ -182,7 +297,7 @@ class RecursiveTaskWindow(QDialog):
         bottom_layout.addStretch()
         
         self.btn_close = QPushButton("Kapat")
-        self.btn_close.setStyleSheet("background-color: #45475a; color: #cdd6f4; padding: 8px 20px;")
+        self.btn_close.setObjectName("CloseButton")
         self.btn_close.clicked.connect(self.accept)
         # Default button olarak ayarlama - Enter tuşunun pencereyi kapatmasını önle
         self.btn_close.setDefault(False)
@@ -198,10 +313,21 @@ class RecursiveTaskWindow(QDialog):
         self._refresh_timer.start(100)  # 100ms debounce
     
     def _do_refresh_tree(self):
-        """Gerçek refresh işlemini yap."""
-        self.refresh_task_tree()
+        """Gerçek refresh işlemini yap (veri değişmediyse atla)."""
+        tasks = self.task_manager.get_all_tasks_flat()
+        if self._snapshot_hash(tasks) == self._last_snapshot_hash:
+            return
+        self.refresh_task_tree(tasks)
+    
+    @staticmethod
+    def _snapshot_hash(tasks) -> int:
+        """Tree'de görünen alanların hash'i - no-op refresh'leri ayırt etmek için."""
+        return hash(tuple(
+            (t.id, t.parent_id, t.name, t.is_completed, t.planned_duration_minutes, t.tag)
+            for t in tasks
+        ))
     
-    def refresh_task_tree(self):
+    def refresh_task_tree(self, tasks=None):
         """Görev ağacını yenile."""
         # Signal döngüsünü önlemek için flag kontrolü
         if self._updating_tree:
@@ -209,31 +335,82 @@ class RecursiveTaskWindow(QDialog):
         
         self._updating_tree = True
         
-        # Signal'leri geçici olarak bloke et
-        self.task_tree.blockSignals(True)
+        # Sadece checkbox signal'ini geçici olarak ayır (diğer tree signal'leri çalışmaya devam eder)
+        self.task_tree.itemChanged.disconnect(self.on_checkbox_changed)
+        
+        # Rebuild bitene kadar ara paint/layout ve sıralama yapılmasın
+        sorting_enabled = self.task_tree.isSortingEnabled()
+        self.task_tree.setSortingEnabled(False)
+        self.task_tree.setUpdatesEnabled(False)
         
         try:
+            # Kullanıcının gördüğü durumu sakla: kapatılmış dallar, seçim ve scroll
+            # (hiç oluşturulmamış item'ların önceki durumu korunur)
+            self._collapsed_ids = {
+                task_id for task_id in self._collapsed_ids if task_id not in self._item_by_id
+            }
+            self._collapsed_ids.update(
+                item.data(0, Qt.UserRole) for item in self._iter_items()
+                if item.childCount() and not item.isExpanded()
+            )
+            selected_items = self.task_tree.selectedItems()
+            selected_id = selected_items[0].data(0, Qt.UserRole) if selected_items else None
+            scroll_pos = self.task_tree.verticalScrollBar().value()
+            
             self.task_tree.clear()
+            self._item_by_id.clear()
             
-            # Root görevleri al
-            root_tasks = self.task_manager.get_root_tasks()
+            # Tüm görevleri tek sorguda al ve parent'a göre grupla
+            if tasks is None:
+                tasks = self.task_manager.get_all_tasks_flat()
+            self._last_snapshot_hash = self._snapshot_hash(tasks)
             
-            # Tree widget'a ekle
-            for root_task in root_tasks:
-                root_item = self._create_tree_item(root_task)
-                self.task_tree.addTopLevelItem(root_item)
-                self._add_children_to_tree(root_item, root_task.id)
+            children_by_parent = {}
+            for task in tasks:
+                children_by_parent.setdefault(task.parent_id, []).append(task)
+            self._children_by_parent = children_by_parent
+            self._task_by_id = {task.id: task for task in tasks}
+            
+            # Alt ağaçları widget dışında kur, sonra tek seferde tree'ye ekle
+            root_items = [
+                self._build_subtree(root_task, children_by_parent)
+                for root_task in children_by_parent.get(None, [])
+            ]
+            self.task_tree.addTopLevelItems(root_items)
+            # Ayrık item'larda setExpanded etkisiz; alt görevi olan her şeyi ekledikten sonra aç
+            self.task_tree.expandAll()
+            
+            # Önceki durumu geri yükle (yeni eklenen dallar açık kalır)
+            for task_id in self._collapsed_ids:
+                item = self._item_by_id.get(task_id)
+                if item is not None:
+                    item.setExpanded(False)
+            selected_item = self._item_by_id.get(selected_id)
+            if selected_item is not None:
+                self.task_tree.setCurrentItem(selected_item)
+            # Scroll aralığı yeni içeriğe göre güncellensin, yoksa değer kırpılır
+            self.task_tree.doItemsLayout()
+            self.task_tree.verticalScrollBar().setValue(scroll_pos)
             
             # Parent combo box'ı güncelle
-            self._refresh_parent_combo()
+            self._refresh_parent_combo(children_by_parent)
             
             # Tag combo box'ı güncelle
             self._refresh_tag_combo()
         finally:
-            # Signal'leri tekrar aktif et
-            self.task_tree.blockSignals(False)
+            self.task_tree.setSortingEnabled(sorting_enabled)
+            self.task_tree.setUpdatesEnabled(True)
+            # Checkbox signal'ini tekrar bağla
+            self.task_tree.itemChanged.connect(self.on_checkbox_changed)
             self._updating_tree = False
     
+    def _iter_items(self):
+        """Tree'deki tüm item'ları (derinlik öncelikli) dolaş."""
+        iterator = QTreeWidgetItemIterator(self.task_tree)
+        while iterator.value():
+            yield iterator.value()
+            iterator += 1
+    
     def _create_tree_item(self, task: Task) -> QTreeWidgetItem:
         """Bir görev için tree item oluştur."""
         item = QTreeWidgetItem()
@@ -248,85 +425,114 @@ class RecursiveTaskWindow(QDialog):
         
         # Task ID'yi sakla
         item.setData(0, Qt.UserRole, task.id)
+        self._item_by_id[task.id] = item
         
         # Tamamlanmış görevler için stil
-        if task.is_completed:
-            item.setForeground(0, QColor("#6c7086"))
-            item.setForeground(1, QColor("#6c7086"))
+        self._apply_completion_style(item, task.is_completed)
         
         return item
     
-    def _add_children_to_tree(self, parent_item: QTreeWidgetItem, parent_id: int):
-        """Bir görevin alt görevlerini tree'ye ekle."""
-        children = self.task_manager.get_child_tasks(parent_id)
-        for child_task in children:
-            child_item = self._create_tree_item(child_task)
-            parent_item.addChild(child_item)
-            # Recursive olarak alt görevlerin alt görevlerini de ekle
-            self._add_children_to_tree(child_item, child_task.id)
-        
-        # Alt görevler varsa expand et
-        if children:
-            parent_item.setExpanded(True)
+    def _apply_completion_style(self, item: QTreeWidgetItem, completed: bool):
+        """Tamamlanmış görevleri soluk göster, diğerlerini varsayılan renge döndür."""
+        brush = QBrush(QColor("#6c7086")) if completed else QBrush()
+        item.setForeground(0, brush)
+        item.setForeground(1, brush)
+    
+    def _build_subtree(self, task: Task, children_by_parent: dict) -> QTreeWidgetItem:
+        """Bir görev ve tüm alt görevleri için tree item'ı oluştur."""
+        item = self._create_tree_item(task)
+        self._add_children_to_tree(item, task.id, children_by_parent)
+        return item
+    
+    def _add_children_to_tree(self, parent_item: QTreeWidgetItem, parent_id: int, children_by_parent: dict):
+        """
+        Bir görevin alt görevlerini tree'ye ekle (recursion yerine explicit stack).
+        Kapalı dalların alt görevleri oluşturulmaz, ilk açılışta on_item_expanded ile yüklenir.
+        """
+        stack = [(parent_item, parent_id)]
+        while stack:
+            item, task_id = stack.pop()
+            children = children_by_parent.get(task_id)
+            if not children:
+                continue
+            
+            if task_id in self._collapsed_ids:
+                item.addChild(QTreeWidgetItem(["...", ""]))
+                item.setData(0, LAZY_LOADED_ROLE, False)
+                continue
+            
+            # Aynı seviyedeki alt görevleri tek seferde ekle
+            child_items = [self._create_tree_item(child_task) for child_task in children]
+            item.addChildren(child_items)
+            
+            stack.extend(zip(child_items, (child_task.id for child_task in children)))
     
-    def _refresh_parent_combo(self):
+    def _refresh_parent_combo(self, children_by_parent: dict):
         """Parent combo box'ı güncelle."""
         self.combo_parent.clear()
         self.combo_parent.addItem("(Ana Görev)", None)
         
-        # Tüm görevleri al ve combo'ya ekle
-        all_tasks = self.task_manager.get_all_tasks_hierarchical()
-        for task in all_tasks:
+        # Derinlik/yol cache'leri sadece bu doldurma için geçerli
+        self._depth_cache = {}
+        self._path_cache = {}
+        by_id = {
+            task.id: task
+            for children in children_by_parent.values()
+            for task in children
+        }
+        
+        # Görevleri hiyerarşik sırada (pre-order) dolaş
+        stack = list(reversed(children_by_parent.get(None, [])))
+        while stack:
+            task = stack.pop()
+            stack.extend(reversed(children_by_parent.get(task.id, [])))
+            
             # Düzenlenen görevi hariç tut (kendisini parent yapamaz)
             if self.editing_task_id and task.id == self.editing_task_id:
                 continue
             
-            # Hiyerarşik isim oluştur
-            display_name = self._get_task_display_name(task)
-            # Girinti ekle (hierarchy için)
-            indent = "  " * self._get_task_depth(task)
+            # Hiyerarşik isim ve girinti (hierarchy için)
+            depth, display_name = self._depth_and_path(task, by_id)
+            indent = "  " * depth
             self.combo_parent.addItem(f"{indent}{display_name}", task.id)
     
-    def _get_task_depth(self, task: Task) -> int:
-        """Bir görevin derinliğini hesapla (root = 0)."""
-        depth = 0
+    def _depth_and_path(self, task: Task, by_id: dict):
+        """
+        Bir görevin derinliğini (root = 0) ve hiyerarşik görünen ismini tek yürüyüşte hesapla.
+        Yukarı çıkarken cache'te bulunan ilk atada durur, yolu aşağı doğru cache'e yazar.
+        """
+        chain = []
+        visited_ids = set()  # Circular reference kontrolü
         current_task = task
-        visited_ids = {task.id}
-        
-        while current_task.parent_id:
-            if current_task.parent_id in visited_ids:
-                break
-            visited_ids.add(current_task.parent_id)
-            parent = self.task_manager.get_task(current_task.parent_id)
-            if not parent:
-                break
-            depth += 1
-            current_task = parent
+        while current_task is not None and current_task.id not in self._depth_cache:
+            if current_task.id in visited_ids:
+                break  # Circular reference tespit edildi
+            visited_ids.add(current_task.id)
+            chain.append(current_task)
+            current_task = by_id.get(current_task.parent_id) if current_task.parent_id else None
         
-        return depth
-    
-    def _get_task_display_name(self, task: Task) -> str:
-        """Görev için hiyerarşik görünen isim oluştur."""
-        # Parent chain'i topla
-        path_parts = [task.name]
-        current_task = task
-        visited_ids = {task.id}  # Circular reference kontrolü
+        if current_task is not None and current_task.id in self._depth_cache:
+            depth = self._depth_cache[current_task.id]
+            path = self._path_cache[current_task.id]
+        else:
+            depth, path = -1, None
         
-        while current_task.parent_id:
-            if current_task.parent_id in visited_ids:
-                break  # Circular reference tespit edildi
-            visited_ids.add(current_task.parent_id)
-            
-            parent = self.task_manager.get_task(current_task.parent_id)
-            if not parent:
-                break
-            path_parts.insert(0, parent.name)
-            current_task = parent
+        for chain_task in reversed(chain):
+            depth += 1
+            path = f"{path} > {chain_task.name}" if path else chain_task.name
+            self._depth_cache[chain_task.id] = depth
+            self._path_cache[chain_task.id] = path
         
-        return " > ".join(path_parts)
+        return self._depth_cache[task.id], self._path_cache[task.id]
     
     def _refresh_tag_combo(self):
         """Tag combo box'ı güncelle."""
+        # Tag'ler değişmediyse combo'yu yeniden kurma
+        tag_version = get_tag_cache_version()
+        if self._last_tag_version == tag_version:
+            return
+        self._last_tag_version = tag_version
+        
         self.combo_tag.clear()
         tags = get_all_tags()
         for tag in tags:
@@ -350,7 +556,7 @@ class RecursiveTaskWindow(QDialog):
         is_checked = item.checkState(0) == Qt.Checked
         
         # Recursive completion mantığını tetikle
-        # Signal'ler otomatik olarak refresh_task_tree'yi çağıracak
+        # Değişen satırlar task_states_changed_signal ile yerinde güncellenecek
         self.task_manager.set_task_completed(task_id, is_checked)
     
     def on_task_selected(self, item: QTreeWidgetItem, column: int):
@@ -459,13 +665,65 @@ class RecursiveTaskWindow(QDialog):
             self.clear_form()
             self.refresh_task_tree()
     
+    def on_item_expanded(self, item: QTreeWidgetItem):
+        """Kapalı bir dal ilk kez açıldığında placeholder'ı gerçek alt görevlerle değiştir."""
+        if item.data(0, LAZY_LOADED_ROLE) is not False:
+            return
+        
+        task_id = item.data(0, Qt.UserRole)
+        self._collapsed_ids.discard(task_id)
+        
+        self._updating_tree = True
+        self.task_tree.itemChanged.disconnect(self.on_checkbox_changed)
+        try:
+            item.takeChildren()
+            self._add_children_to_tree(item, task_id, self._children_by_parent)
+            item.setData(0, LAZY_LOADED_ROLE, True)
+            
+            # Yeni oluşturulan (kapalı olmayan) alt dalları aç
+            pending = [item.child(i) for i in range(item.childCount())]
+            while pending:
+                child = pending.pop()
+                if child.childCount() and child.data(0, LAZY_LOADED_ROLE) is not False:
+                    child.setExpanded(True)
+                    pending.extend(child.child(i) for i in range(child.childCount()))
+        finally:
+            self.task_tree.itemChanged.connect(self.on_checkbox_changed)
+            self._updating_tree = False
+    
+    def on_task_states_changed(self, task_ids: list):
+        """Tamamlanma durumu değişen görevleri tree'de yerinde güncelle (full rebuild yok)."""
+        self._updating_tree = True
+        self.task_tree.itemChanged.disconnect(self.on_checkbox_changed)
+        try:
+            for task_id in task_ids:
+                task = self.task_manager.get_task(task_id)
+                if task is None:
+                    continue
+                # Henüz oluşturulmamış (lazy) item'lar ilk açılışta güncel durumla oluşsun
+                cached_task = self._task_by_id.get(task_id)
+                if cached_task is not None:
+                    cached_task.is_completed = task.is_completed
+                
+                item = self._item_by_id.get(task_id)
+                if item is None:
+                    continue
+                item.setCheckState(0, Qt.Checked if task.is_completed else Qt.Unchecked)
+                self._apply_completion_style(item, task.is_completed)
+            # Tree artık bu veriyi gösteriyor; sonraki refresh "değişti" sanıp rebuild etmesin
+            if self._last_snapshot_hash is not None:
+                self._last_snapshot_hash = self._snapshot_hash(self._task_by_id.values())
+        finally:
+            self.task_tree.itemChanged.connect(self.on_checkbox_changed)
+            self._updating_tree = False
+    
     def on_task_completed(self, task_id: int):
         """Görev tamamlandığında çağrılır."""
-        pass  # Tree zaten refresh_task_tree ile güncelleniyor
+        pass  # Tree on_task_states_changed ile güncelleniyor
     
     def on_task_uncompleted(self, task_id: int):
         """Görev tamamlanmadığında çağrılır."""
-        pass  # Tree zaten refresh_task_tree ile güncelleniyor
+        pass  # Tree on_task_states_changed ile güncelleniyor
     
     def add_as_subtask(self):
         """Seçili görevin alt görevi olarak ekleme moduna geç."""
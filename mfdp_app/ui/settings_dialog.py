@@ -1,7 +1,7 @@
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QLabel, QSpinBox, 
                                QPushButton, QHBoxLayout, QFormLayout)
 from PySide6.QtCore import Qt
-from mfdp_app.db_manager import load_settings, save_setting
+from mfdp_app.db_manager import load_settings, save_settings
 
 class SettingsDialog(QDialog):
     def __init__(self, parent=None):
@@ -45,8 +45,7 @@ class SettingsDialog(QDialog):
         
         self.layout.addWidget(self.btn_save)
 
-        # Mevcut değerleri yükle
-        self.load_current_values()
+        # Değerler her açılışta load_current_values() ile yüklenir (bkz. MainWindow.open_settings)
 
     def load_current_values(self):
         settings = load_settings()
@@ -56,9 +55,11 @@ class SettingsDialog(QDialog):
         self.spin_long.setValue(int(settings.get('long_break_duration', 15)))
 
     def save_values(self):
-        # Değerleri Veritabanına Yaz
-        save_setting('focus_duration', self.spin_focus.value())
-        save_setting('short_break_duration', self.spin_short.value())
-        save_setting('long_break_duration', self.spin_long.value())
+        # Değerleri Veritabanına Yaz (tek transaction)
+        save_settings({
+            'focus_duration': self.spin_focus.value(),
+            'short_break_duration': self.spin_short.value(),
+            'long_break_duration': self.spin_long.value(),
+        })
         
         self.accept() # Pencereyi kapat ve 'kabul edildi' sinyali ver
\ No newline at end of file
@@ -1,287 +1,650 @@
-from PySide6.QtWidgets import (QDialog, QVBoxLayout, QLabel, QWidget, QScrollArea, QHBoxLayout)
-from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QLabel, QWidget, QHBoxLayout, QTabWidget, QScrollArea)
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, QRectF, QPointF, Signal, Slot
+from PySide6.QtGui import QPainter, QColor, QPen, QFont
+import math
+import matplotlib as mpl
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
+from matplotlib.gridspec import GridSpec
 from mfdp_app.db_manager import (
     get_daily_trend_v2, get_hourly_productivity_v2, get_completion_rate_v2, 
-    get_focus_quality_stats, get_all_tags, get_daily_trend_by_tag
+    get_focus_quality_stats, get_all_tags, get_daily_trend_all_tags,
+    get_all_tag_time_summary, get_day_labels, get_data_version
 )
 import numpy as np
 
+# Pencere, grafik ve pasta widget'ının ortak renkleri
+STATS_COLORS = {
+    'background': '#1e1e2e',
+    'surface': '#313244',
+    'grid': '#45475a',
+    'text': '#cdd6f4',
+    'subtext': '#bac2de',
+    'primary': '#89b4fa',
+    'accent': '#a6e3a1',
+    'muted': '#6c7086',
+    'pie_text': '#C3CDEF',
+    # Odaklanma kalitesi dilimleri: Deep, Moderate, Distracted
+    'quality_deep': '#175611',
+    'quality_moderate': '#7e5f1c',
+    'quality_distracted': '#821628',
+}
+
+# Koyu tema grafik stili - modül yüklenirken bir kez uygulanır, axes'ler hazır temalı gelir
+MFDP_RC = {
+    'figure.facecolor': STATS_COLORS['background'],
+    'axes.facecolor': STATS_COLORS['background'],
+    'axes.edgecolor': STATS_COLORS['grid'],
+    'axes.labelcolor': STATS_COLORS['subtext'],
+    'axes.titlecolor': STATS_COLORS['text'],
+    'axes.titlesize': 12,
+    'axes.titlepad': 15,
+    'axes.spines.top': False,
+    'axes.spines.right': False,
+    'axes.grid': True,
+    'grid.color': STATS_COLORS['grid'],
+    'grid.linestyle': '--',
+    'grid.linewidth': 0.5,
+    'grid.alpha': 0.5,
+    'xtick.color': STATS_COLORS['subtext'],
+    'ytick.color': STATS_COLORS['subtext'],
+    'text.color': STATS_COLORS['text'],
+    'legend.facecolor': STATS_COLORS['surface'],
+    'legend.edgecolor': STATS_COLORS['grid'],
+    'legend.labelcolor': STATS_COLORS['text'],
+}
+mpl.rcParams.update(MFDP_RC)
+
+# Rengi atanmamış tag'ler için sırayla kullanılan palet
+DEFAULT_TAG_COLORS = (STATS_COLORS['primary'], STATS_COLORS['accent'], '#f9e2af', '#f38ba8', '#cba6f7', '#fab387', '#94e2d5', '#f5c2e7')
+
+# Sekmeler ve her sekmeyi dolduran init_* metodları (sırasıyla)
+STATS_TABS = (
+    ("Genel", ("init_header", "init_quality_section")),
+    ("Trendler", ("init_trend_charts",)),
+    ("Tag Dağılımı", ("init_tag_distribution",)),
+)
+TREND_TAB = next(i for i, (_, methods) in enumerate(STATS_TABS) if "init_trend_charts" in methods)
+
+STATS_WINDOW_QSS = f"""
+QWidget {{
+    background-color: {STATS_COLORS['background']};
+    color: {STATS_COLORS['text']};
+}}
+QTabWidget::pane {{
+    border: none;
+}}
+QTabBar::tab {{
+    background-color: {STATS_COLORS['surface']};
+    padding: 6px 14px;
+    margin-right: 4px;
+    border-radius: 6px;
+}}
+QTabBar::tab:selected {{
+    background-color: {STATS_COLORS['grid']};
+    color: {STATS_COLORS['accent']};
+}}
+"""
+
+# get_focus_quality_stats anahtarları (Deep, Moderate, Distracted sırasıyla)
+QUALITY_KEYS = ('Deep Work (0 Kesinti)', 'Moderate (1-2 Kesinti)', 'Distracted (3+ Kesinti)')
+
+# Odaklanma karnesi metin parçaları (_generate_insight sayıları format_map ile yerleştirir)
+INSIGHT_NO_DATA = "Analiz için yeterli veri yok."
+INSIGHT_HEADER = "<b>📊 Odaklanma Karnesi</b><br><br>"
+INSIGHT_DEEP = "🚀 <b>Mükemmel Disiplin!</b><br>Oturumlarının büyük çoğunluğu kesintisiz. 'Deep Work' moduna girmekte ustasın.<br><br>"
+INSIGHT_MODERATE = "⚖️ <b>Dengeli Performans.</b><br>Genellikle iyi odaklanıyorsun ama bazen dikkat dağıtıcılar araya giriyor. Küçük molaları kontrol etmeyi deneyebilirsin.<br><br>"
+INSIGHT_DISTRACTED = "⚠️ <b>Dikkat Dağınıklığı Yüksek.</b><br>Çoğu oturumun bölünmüş durumda. Bildirimleri kapatmayı veya ortamını değiştirmeyi dene.<br><br>"
+INSIGHT_DEEP_LINE = "• Toplam <b>{total}</b> oturumun <b>{deep}</b> tanesi (%{deep_pct}) tamamen kesintisizdi.<br>"
+INSIGHT_MODERATE_LINE = "• <b>{moderate}</b> oturum (%{moderate_pct}) orta düzeyde kesinti yaşadı (1-2 kez).<br>"
+INSIGHT_DISTRACTED_LINE = "• <b>{distracted}</b> oturum (%{distracted_pct}) yüksek kesinti yaşadı (3+ kez). Bu zaman aralıklarını incelemelisin."
+
+
+# Dilim sayısı bunu aşarsa küçük dilimlerin yüzde yazıları çizilmez (lejantta zaten var)
+PIE_MAX_LABELED_SLICES = 5
+PIE_MIN_LABEL_PERCENT = 5
+# Tag pastasında toplamın bu oranını tamamlayan kuyruk dilimleri "Diğer" altında birleştirilir
+PIE_OTHER_THRESHOLD = 0.99
+
+
+class PieWidget(QWidget):
+    """Birkaç dilimlik pasta grafik için hafif QPainter widget'ı (matplotlib yerine)."""
+    def __init__(self, title, text_color=STATS_COLORS['text'], parent=None):
+        super().__init__(parent)
+        self._title = title
+        self._text_color = QColor(text_color)
+        self._colors = []
+        self._labels = []
+        self._starts = self._spans = self._percents = np.zeros(0)
+        self._show_percent = np.zeros(0, dtype=bool)
+        self.setMinimumSize(320, 280)
+
+    def set_data(self, sizes, colors, labels):
+        sizes = np.asarray(sizes, dtype=float)
+        self._colors = [QColor(c) for c in colors]
+        self._labels = list(labels)
+
+        # Açılar ve yüzdeler veri değiştiğinde bir kez hesaplanır, paintEvent sadece çizer.
+        # Qt açıları 1/16 derece; matplotlib'deki startangle=90 ile aynı başlangıç
+        total = sizes.sum()
+        if total > 0:
+            self._spans = sizes * (360 * 16) / total
+            self._starts = 90 * 16 + np.concatenate(([0.0], np.cumsum(self._spans)[:-1]))
+            self._percents = sizes * 100 / total
+        else:
+            self._starts = self._spans = self._percents = np.zeros(0)
+        self._show_percent = self._spans > 0
+        if len(sizes) > PIE_MAX_LABELED_SLICES:
+            self._show_percent &= self._percents >= PIE_MIN_LABEL_PERCENT
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Başlık
+        title_font = QFont(self.font())
+        title_font.setPointSize(12)
+        painter.setFont(title_font)
+        painter.setPen(self._text_color)
+        title_height = 30
+        painter.drawText(QRectF(0, 0, self.width(), title_height), Qt.AlignCenter, self._title)
+
+        if not len(self._spans):
+            painter.end()
+            return
+
+        # Sol tarafta pasta, sağ tarafta lejant
+        legend_width = self.width() * 0.4
+        side = min(self.width() - legend_width, self.height() - title_height) - 20
+        pie_rect = QRectF(10, title_height + (self.height() - title_height - side) / 2, side, side)
+        center = pie_rect.center()
+        radius = side / 2
+
+        painter.setPen(QPen(QColor(STATS_COLORS['background']), 1))
+        for start, span, color in zip(self._starts, self._spans, self._colors):
+            if span > 0:
+                painter.setBrush(color)
+                painter.drawPie(pie_rect, int(start), int(round(span)))
+
+        # Yüzdeler dilimlerin ortasına
+        text_font = QFont(self.font())
+        text_font.setPointSize(9)
+        painter.setFont(text_font)
+        painter.setPen(self._text_color)
+        for start, span, pct, show in zip(self._starts, self._spans, self._percents, self._show_percent):
+            if not show:
+                continue
+            mid = math.radians((start + span / 2) / 16)
+            pos = QPointF(center.x() + radius * 0.65 * math.cos(mid),
+                          center.y() - radius * 0.65 * math.sin(mid))
+            painter.drawText(QRectF(pos.x() - 30, pos.y() - 10, 60, 20), Qt.AlignCenter, f"{pct:.1f}%")
+
+        # Lejant
+        x = pie_rect.right() + 20
+        y = title_height + 10
+        for label, color, pct in zip(self._labels, self._colors, self._percents):
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(color)
+            painter.drawRect(QRectF(x, y + 4, 12, 12))
+            painter.setPen(self._text_color)
+            painter.drawText(QRectF(x + 18, y, self.width() - x - 18, 20),
+                             Qt.AlignLeft | Qt.AlignVCenter, f"{label} ({pct:.1f}%)")
+            y += 24
+
+        painter.end()
+
+
+# Her biri ayrı worker'da paralel çalışan istatistik sorguları: (anahtar, fonksiyon, argümanlar)
+STATS_QUERIES = (
+    ('completion', get_completion_rate_v2, ()),
+    ('daily', get_daily_trend_v2, (7,)),
+    ('tags', get_all_tags, ()),
+    ('tag_trend', get_daily_trend_all_tags, (7,)),
+    ('tag_totals', get_all_tag_time_summary, ()),
+    ('hourly', get_hourly_productivity_v2, ()),
+    ('quality', get_focus_quality_stats, ()),
+)
+
+
+class StatsLoaderSignals(QObject):
+    finished = Signal(int, str, object)  # load_id, sorgu anahtarı, sonuç
+
+
+class StatsQueryWorker(QRunnable):
+    """Tek bir istatistik sorgusunu GUI thread dışında çalıştırır."""
+    def __init__(self, load_id, key, func, args):
+        super().__init__()
+        self.load_id = load_id
+        self.key = key
+        self.func = func
+        self.args = args
+        self.signals = StatsLoaderSignals()
+
+    def run(self):
+        self.signals.finished.emit(self.load_id, self.key, self.func(*self.args))
+
+
 class StatsWindow(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Verimlilik Analizi - MFDP")
         self.resize(700, 800)
-        self.setStyleSheet("background-color: #1e1e2e; color: #cdd6f4;")
+        self.setStyleSheet(STATS_WINDOW_QSS)
         
         # Non-modal yap - arka plandaki pencereyi kullanılabilir tut
         self.setModal(False)
 
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("border: none;") 
-        container = QWidget()
-        scroll.setWidget(container)
-        
-        self.layout = QVBoxLayout(container)
-        self.layout.setSpacing(30)
-        self.layout.setContentsMargins(20, 20, 20, 20)
+        # Her bölüm kendi sekmesinde; grafikler sekme ilk açıldığında oluşturulur
+        self.tabs = QTabWidget()
+        self._tab_layouts = []
+        self._built = set()
+        self._placeholders = {}  # sekme index'i -> 'Yükleniyor...' etiketi
+        self._data = None
+        self._load_id = 0
+        self._workers = []
+        self._pending = {}
+        self._loading_version = None
+        self._data_version = None  # Gösterilen verinin yüklendiği DB versiyonu
+        self._trend = {}  # Trend grafiklerinin artist'leri (yerinde güncelleme için)
+        for title, _ in STATS_TABS:
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setSpacing(30)
+            page_layout.setContentsMargins(20, 20, 20, 20)
+            self._tab_layouts.append(page_layout)
+            self.tabs.addTab(page, title)
+        self.tabs.currentChanged.connect(self._build_tab)
         
         main_layout = QVBoxLayout(self)
-        main_layout.addWidget(scroll)
+        main_layout.addWidget(self.tabs)
+
+        self.refresh()
+
+    def refresh(self):
+        """Verileri arka planda yeniden yükle; sekmeler yeni veri gelince güncellenir."""
+        self._load_id += 1  # Bekleyen yüklemeyi geçersiz kıl
+        day_labels = get_day_labels(7)
+        if (self._data is not None and self._data_version == get_data_version()
+                and self._data['day_labels'] == day_labels):
+            # Yazma olmadı ve gün değişmedi: mevcut grafikler olduğu gibi kalır
+            self._workers = []
+            self._pending = {}
+            return
+
+        if self._data is None:
+            # İlk yükleme: gösterilecek veri yok
+            self._show_placeholder(self.tabs.currentIndex())
+        # Aksi halde mevcut sekmeler ve _data yeni veri gelene kadar kalır;
+        # _apply_data trend grafiklerini yerinde günceller
 
-        self.init_header()
-        self.init_daily_chart()
-        self.init_daily_chart_by_tag()
-        self.init_tag_distribution()
-        self.init_hourly_chart()
-        self.init_quality_section()
+        # Sorgulardan önce alınır; yükleme sırasında yazma olursa sonraki refresh yeniden yükler
+        self._loading_version = get_data_version()
+        self._pending = {'day_labels': day_labels}
+        # Sorgular paralel çalışır; toplam süre en yavaş sorgu kadar olur.
+        # Değişmeyen sorgular db_manager'daki memo'dan hemen döner.
+        self._workers = []
+        pool = QThreadPool.globalInstance()
+        for key, func, args in STATS_QUERIES:
+            worker = StatsQueryWorker(self._load_id, key, func, args)
+            worker.signals.finished.connect(self._on_query_finished)
+            self._workers.append(worker)
+            pool.start(worker)
 
-    def init_header(self):
-        stats = get_completion_rate_v2()
+    @Slot(int, str, object)
+    def _on_query_finished(self, load_id, key, result):
+        """Tüm sorgular bitince açık olan sekmeyi oluştur."""
+        if load_id != self._load_id:
+            return  # Daha yeni bir refresh başlatılmış, eski sonucu at
+        self._pending[key] = result
+        if any(query_key not in self._pending for query_key, _, _ in STATS_QUERIES):
+            return
+        data, self._pending = self._pending, {}
+        self._workers = []
+        self._data_version = self._loading_version
+        self._apply_data(data)
+
+    def _apply_data(self, data):
+        old_data, self._data = self._data, data
+        # Trend sekmesi oluşturulmuşsa (o sırada old_data vardı) figür/canvas/scroll korunur:
+        # yapı (tag'ler, günler) aynıysa sadece veri, değilse sadece axes yenilenir
+        keep_trend = TREND_TAB in self._built
+        for index in list(self._built):
+            if index != TREND_TAB:
+                self._clear_tab(index)
+        if keep_trend:
+            if self._trend_signature(old_data) == self._trend_signature(data):
+                self._update_trend_charts()
+            else:
+                self._rebuild_trend_axes()
+        self._build_tab(self.tabs.currentIndex())
+
+    def _clear_tab(self, index):
+        if index == TREND_TAB and 'canvas' in self._trend:
+            # deleteLater'dan önce axes/artist referanslarını bırak (tekrar açılışlarda bellek birikmesin)
+            self._trend['canvas'].figure.clear()
+            self._trend = {}
+        layout = self._tab_layouts[index]
+        while layout.count():
+            item = layout.takeAt(0)
+            if item.widget() is not None:
+                item.widget().deleteLater()
+        self._placeholders.pop(index, None)
+        self._built.discard(index)
+
+    def _show_placeholder(self, index):
+        """Veri gelene kadar sekmede 'Yükleniyor...' göster (sekme başına en fazla bir tane)."""
+        if index in self._placeholders or index in self._built:
+            return
+        placeholder = QLabel("Yükleniyor...")
+        placeholder.setAlignment(Qt.AlignCenter)
+        self._tab_layouts[index].addWidget(placeholder)
+        self._placeholders[index] = placeholder
+
+    def _remove_placeholder(self, index):
+        placeholder = self._placeholders.pop(index, None)
+        if placeholder is not None:
+            self._tab_layouts[index].removeWidget(placeholder)
+            placeholder.deleteLater()
+
+    def _build_tab(self, index):
+        """Sekme daha önce oluşturulmadıysa bölümlerini oluştur."""
+        if index < 0 or index in self._built:
+            return
+        if self._data is None:
+            # Yükleme sürerken açılan sekme boş kalmasın; veri gelince bu sekme oluşturulur
+            self._show_placeholder(index)
+            return
+        self._remove_placeholder(index)
+        self._built.add(index)
+        layout = self._tab_layouts[index]
+        # Tüm canvas'lar eklenene kadar ara boyamaları engelle
+        self.setUpdatesEnabled(False)
+        try:
+            for method_name in STATS_TABS[index][1]:
+                getattr(self, method_name)(layout)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def init_header(self, layout):
+        stats = self._data['completion']
         total = stats['completed'] + stats['interrupted']
         rate = int((stats['completed'] / total * 100)) if total > 0 else 0
         header_text = f"Tamamlama Oranı: %{rate} ({stats['completed']} Tam / {total} Toplam)"
         
         lbl = QLabel(header_text)
-        lbl.setStyleSheet("font-size: 18px; font-weight: bold; color: #a6e3a1; padding: 10px; background-color: #313244; border-radius: 8px;")
+        lbl.setStyleSheet(f"font-size: 18px; font-weight: bold; color: {STATS_COLORS['accent']}; padding: 10px; background-color: {STATS_COLORS['surface']}; border-radius: 8px;")
         lbl.setAlignment(Qt.AlignCenter)
-        self.layout.addWidget(lbl)
+        layout.addWidget(lbl)
 
-    def _create_figure(self):
-        fig = Figure(figsize=(6, 4), dpi=100, facecolor='#1e1e2e')
-        return fig
+    def _create_figure(self, rows=1):
+        # Ekranın mantıksal DPI'ı ile her satır 600x400 piksel; Agg buffer gereğinden büyük olmaz.
+        # constrained layout tek idle çizim sırasında, tight_layout'tan daha ucuz çözülür.
+        dpi = self.logicalDpiX()
+        return Figure(figsize=(600 / dpi, 400 * rows / dpi), dpi=dpi, layout='constrained')
 
     def _setup_ax(self, ax, title, xlabel, ylabel):
-        ax.set_facecolor('#1e1e2e')
-        ax.set_title(title, color='#cdd6f4', fontsize=12, pad=15)
-        ax.set_xlabel(xlabel, color='#bac2de')
-        ax.set_ylabel(ylabel, color='#bac2de')
-        ax.tick_params(axis='x', colors='#bac2de', rotation=45)
-        ax.tick_params(axis='y', colors='#bac2de')
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['bottom'].set_color('#45475a')
-        ax.spines['left'].set_color('#45475a')
-        ax.grid(color='#45475a', linestyle='--', linewidth=0.5, alpha=0.5)
-
-    def init_daily_chart(self):
-        data = get_daily_trend_v2(7)
-        days = [x[0] for x in data]
-        minutes = [x[1] for x in data]
-
-        fig = self._create_figure()
+        # Renkler, spine'lar ve grid MFDP_RC'den gelir; metinler tek ax.set çağrısıyla
+        ax.set(title=title, xlabel=xlabel, ylabel=ylabel)
+        ax.tick_params(axis='x', rotation=45)
+
+    def _label_bars(self, ax, bars, values, fontsize):
+        """Bar üstü değer etiketleri (sıfırlar boş); tamamen sıfır seride hiç Text oluşturulmaz."""
+        values = np.asarray(values)
+        if not values.any():
+            return []
+        labels = np.where(values > 0, values.astype(int).astype(str), '')
+        return ax.bar_label(bars, labels=labels, fontsize=fontsize)
+
+    def _trend_signature(self, data):
+        """Trend figürünün eksen yapısını belirleyen değerler."""
+        tags = tuple((t['name'], t.get('color')) for t in data['tags'])
+        return tags, tuple(data['day_labels']), tuple(data['daily'][0])
+
+    def _tag_matrix(self):
+        """Tag trend satırlarını (tag x gün) matrisine tek seferde yerleştir."""
+        tags = self._data['tags']
+        days = self._data['day_labels']
+        tag_idx = {tag_info['name']: i for i, tag_info in enumerate(tags)}
+        day_idx = {day: i for i, day in enumerate(days)}
+        rows = [r for r in self._data['tag_trend'] if r[1] in tag_idx and r[0] in day_idx]
+        matrix = np.zeros((len(tags), len(days)), dtype=np.float32)
+        if rows:
+            ti = np.fromiter((tag_idx[r[1]] for r in rows), dtype=np.int32, count=len(rows))
+            di = np.fromiter((day_idx[r[0]] for r in rows), dtype=np.int32, count=len(rows))
+            matrix[ti, di] = np.fromiter((r[2] for r in rows), dtype=np.float32, count=len(rows))
+        return matrix
+
+    def _update_bars(self, ax, bars, labels, values, fontsize):
+        """Bar yüksekliklerini ve etiketlerini yerinde güncelle, yeni etiketleri döndür."""
+        for bar, value in zip(bars, values):
+            bar.set_height(value)
+        for text in labels:
+            text.remove()
+        return self._label_bars(ax, bars, values, fontsize)
+
+    def _update_trend_charts(self):
+        """Figürü yeniden kurmadan trend grafiklerinin verisini güncelle."""
+        trend = self._trend
+        ax, bars, labels = trend['daily']
+        minutes = self._data['daily'][1]
+        trend['daily'] = (ax, bars, self._update_bars(ax, bars, labels, minutes, 8))
+        axes = [ax]
+
+        if 'by_tag' in trend:
+            ax, containers, label_sets = trend['by_tag']
+            matrix = self._tag_matrix()
+            label_sets = [self._update_bars(ax, bars, labels, matrix[i], 7)
+                          for i, (bars, labels) in enumerate(zip(containers, label_sets))]
+            trend['by_tag'] = (ax, containers, label_sets)
+            axes.append(ax)
+
+        ax, line, fill = trend['hourly']
+        hours = line.get_xdata()
+        hours_data = self._data['hourly']
+        line.set_ydata(hours_data)
+        fill.remove()
+        fill = ax.fill_between(hours, hours_data, color=STATS_COLORS['accent'], alpha=0.2)
+        trend['hourly'] = (ax, line, fill)
+        axes.append(ax)
+
+        for ax in axes:
+            ax.relim()
+            ax.autoscale_view()
+        trend['canvas'].draw_idle()
+
+    def _trend_sections(self):
+        sections = [self.init_daily_chart]
+        if self._data['tags']:
+            sections.append(self.init_daily_chart_by_tag)
+        sections.append(self.init_hourly_chart)
+        return sections
+
+    def _draw_trend_axes(self, fig, sections):
+        grid = GridSpec(len(sections), 1, figure=fig)
+        for i, build in enumerate(sections):
+            build(fig.add_subplot(grid[i]))
+
+    def _rebuild_trend_axes(self):
+        """Tag/gün yapısı değişti: aynı Figure ve canvas üzerinde axes'leri yeniden kur."""
+        canvas = self._trend['canvas']
+        fig = canvas.figure
+        fig.clear()
+        self._trend = {'canvas': canvas}
+        sections = self._trend_sections()
+        self._draw_trend_axes(fig, sections)
+        canvas.setMinimumHeight(400 * len(sections))
+        canvas.draw_idle()
+
+    def init_trend_charts(self, layout):
+        """Bar/çizgi grafikleri tek Figure üzerinde alt alta çiz (tek canvas, tek Agg buffer)."""
+        sections = self._trend_sections()
+        fig = self._create_figure(len(sections))
+        self._draw_trend_axes(fig, sections)
+
         canvas = FigureCanvas(fig)
-        ax = fig.add_subplot(111)
-        bars = ax.bar(days, minutes, color='#89b4fa', width=0.6, alpha=0.8)
+        canvas.setMinimumHeight(int(fig.get_figheight() * fig.dpi))
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setFrameShape(QScrollArea.NoFrame)
+        scroll.setWidget(canvas)
+        layout.addWidget(scroll)
+        canvas.draw_idle()
+        self._trend['canvas'] = canvas
+
+    def init_daily_chart(self, ax):
+        days, minutes = self._data['daily']
+
+        bars = ax.bar(days, minutes, color=STATS_COLORS['primary'], width=0.6, alpha=0.8)
         self._setup_ax(ax, "Son 7 Günlük Trend (Toplam)", "Günler", "Dakika")
 
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0:
-                ax.text(bar.get_x() + bar.get_width()/2., height, f'{int(height)}',
-                        ha='center', va='bottom', color='#cdd6f4', fontsize=8)
-        fig.tight_layout()
-        self.layout.addWidget(canvas)
+        labels = self._label_bars(ax, bars, minutes, 8)
+        self._trend['daily'] = (ax, bars, labels)
     
-    def init_daily_chart_by_tag(self):
+    def init_daily_chart_by_tag(self, ax):
         """Tag bazlı günlük trend grafiği (grouped bar chart)."""
-        tags = get_all_tags()
-        if not tags:
-            return  # Tag yoksa grafik gösterme
+        tags = self._data['tags']
+        days = self._data['day_labels']
         
-        # Her tag için veri al
-        tag_data = {}
-        days_set = set()
-        for tag_info in tags:
-            tag = tag_info['name']
-            data = get_daily_trend_by_tag(tag, 7)
-            tag_data[tag] = {day: minutes for day, minutes in data}
-            days_set.update([day for day, _ in data])
+        # Tüm tag'lerin verisi tek sorguda geldi, (tag x gün) matrisine tek seferde yerleştir
+        matrix = self._tag_matrix()
         
-        if not days_set:
-            return  # Veri yoksa gösterme
-        
-        days = sorted(list(days_set))
-        if not days:
-            return
-        
-        fig = self._create_figure()
-        canvas = FigureCanvas(fig)
-        ax = fig.add_subplot(111)
-        
-        # Tag renklerini al
-        tag_colors = {}
-        default_colors = ['#89b4fa', '#a6e3a1', '#f9e2af', '#f38ba8', '#cba6f7', '#fab387', '#94e2d5', '#f5c2e7']
-        for i, tag_info in enumerate(tags):
-            tag = tag_info['name']
-            tag_colors[tag] = tag_info.get('color') or default_colors[i % len(default_colors)]
+        # Tag renkleri bir kez hesaplanır, bar döngüsünde sadece index ile okunur
+        colors = [tag_info.get('color') or DEFAULT_TAG_COLORS[i % len(DEFAULT_TAG_COLORS)]
+                  for i, tag_info in enumerate(tags)]
         
         # Grouped bar chart için
         x = np.arange(len(days))
         width = 0.8 / len(tags)  # Her tag için genişlik
+        # Tüm tag'lerin bar konumları tek seferde: (tag x gün)
+        offsets = (np.arange(len(tags)) - len(tags) / 2 + 0.5) * width
+        positions = x + offsets[:, None]
+        containers = []
+        label_sets = []
         
         for i, tag in enumerate(tags):
             tag_name = tag['name']
-            minutes = [tag_data[tag_name].get(day, 0) for day in days]
-            offset = (i - len(tags) / 2 + 0.5) * width
-            bars = ax.bar(x + offset, minutes, width, label=tag_name, 
-                         color=tag_colors[tag_name], alpha=0.8)
+            minutes = matrix[i]
+            bars = ax.bar(positions[i], minutes, width, label=tag_name, 
+                         color=colors[i], alpha=0.8)
             
             # Değerleri göster
-            for j, (bar, val) in enumerate(zip(bars, minutes)):
-                if val > 0:
-                    ax.text(bar.get_x() + bar.get_width()/2., val, f'{int(val)}',
-                           ha='center', va='bottom', color='#cdd6f4', fontsize=7)
+            containers.append(bars)
+            label_sets.append(self._label_bars(ax, bars, minutes, 7))
         
-        ax.set_xlabel("Günler", color='#bac2de')
-        ax.set_ylabel("Dakika", color='#bac2de')
-        ax.set_title("Son 7 Günlük Trend (Tag Bazlı)", color='#cdd6f4', fontsize=12, pad=15)
+        self._setup_ax(ax, "Son 7 Günlük Trend (Tag Bazlı)", "Günler", "Dakika")
         ax.set_xticks(x)
-        ax.set_xticklabels(days, rotation=45, color='#bac2de')
-        ax.tick_params(axis='y', colors='#bac2de')
-        ax.legend(loc='upper left', facecolor='#313244', edgecolor='#45475a', labelcolor='#cdd6f4')
-        ax.set_facecolor('#1e1e2e')
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['bottom'].set_color('#45475a')
-        ax.spines['left'].set_color('#45475a')
-        ax.grid(color='#45475a', linestyle='--', linewidth=0.5, alpha=0.5, axis='y')
-        
-        fig.tight_layout()
-        self.layout.addWidget(canvas)
+        ax.set_xticklabels(days)
+        ax.grid(False, axis='x')
+        ax.legend(loc='upper left')
+        self._trend['by_tag'] = (ax, containers, label_sets)
     
-    def init_tag_distribution(self):
+    def init_tag_distribution(self, layout):
         """Tag bazlı zaman dağılımı pasta grafiği."""
-        from mfdp_app.db_manager import get_tag_time_summary
-        
-        tags = get_all_tags()
+        tags = self._data['tags']
         if not tags:
             return
         
-        # Her tag için toplam süre
-        tag_times = {}
-        for tag_info in tags:
-            tag = tag_info['name']
-            total_minutes = get_tag_time_summary(tag)
-            if total_minutes > 0:
-                tag_times[tag] = {
-                    'minutes': total_minutes,
-                    'color': tag_info.get('color') or '#89b4fa'
-                }
-        
-        if not tag_times:
+        # Her tag için toplam süre (tek sorgu), tag sırasına göre diziye yerleştir
+        totals = dict(self._data['tag_totals'])
+        minutes = np.fromiter((totals.get(t['name'], 0.0) for t in tags), dtype=float, count=len(tags))
+        used = np.flatnonzero(minutes > 0)
+        if not len(used):
             return
         
         # Pasta grafik için veri hazırla
-        labels = list(tag_times.keys())
-        sizes = [tag_times[tag]['minutes'] for tag in labels]
-        colors = [tag_times[tag]['color'] for tag in labels]
-        
-        fig = self._create_figure()
-        canvas = FigureCanvas(fig)
-        ax = fig.add_subplot(111)
-        
-        wedges, texts, autotexts = ax.pie(sizes, labels=labels, autopct='%1.1f%%',
-                                         startangle=90, colors=colors,
-                                         textprops=dict(color="#cdd6f4"))
-        
-        ax.set_title("Tag Bazlı Zaman Dağılımı", color='#cdd6f4', fontsize=12)
-        fig.patch.set_facecolor('#1e1e2e')
+        labels = [tags[i]['name'] for i in used]
+        sizes = minutes[used]
+        colors = [tags[i].get('color') or STATS_COLORS['primary'] for i in used]
+
+        # Büyükten küçüğe sırala; toplamın son %1'ini oluşturan küçük dilimleri tek dilimde topla
+        order = np.argsort(sizes)[::-1]
+        sizes = sizes[order]
+        labels = [labels[i] for i in order]
+        colors = [colors[i] for i in order]
+        keep = int(np.searchsorted(np.cumsum(sizes) / sizes.sum(), PIE_OTHER_THRESHOLD)) + 1
+        if keep < len(sizes) - 1:
+            sizes = np.append(sizes[:keep], sizes[keep:].sum())
+            labels = labels[:keep] + ["Diğer"]
+            colors = colors[:keep] + [STATS_COLORS['muted']]
         
-        fig.tight_layout()
-        self.layout.addWidget(canvas)
+        pie = PieWidget("Tag Bazlı Zaman Dağılımı")
+        pie.set_data(sizes, colors, labels)
+        layout.addWidget(pie)
 
-    def init_hourly_chart(self):
-        hours_data = get_hourly_productivity_v2()
-        hours = list(range(24))
+    def init_hourly_chart(self, ax):
+        # Diziler bir kez oluşturulur; fill_between ve plot aynı ndarray'leri kullanır
+        hours = np.arange(24)
+        hours_data = self._data['hourly']  # DB'den hazır int32 dizi olarak gelir
         
-        fig = self._create_figure()
-        canvas = FigureCanvas(fig)
-        ax = fig.add_subplot(111)
-        ax.fill_between(hours, hours_data, color='#a6e3a1', alpha=0.2)
-        ax.plot(hours, hours_data, color='#a6e3a1', linewidth=2, marker='o', markersize=4)
+        fill = ax.fill_between(hours, hours_data, color=STATS_COLORS['accent'], alpha=0.2)
+        line, = ax.plot(hours, hours_data, color=STATS_COLORS['accent'], linewidth=2, marker='o', markersize=4)
         self._setup_ax(ax, "Saatlik Verimlilik", "Saat (00-23)", "Toplam Dakika")
         ax.set_xticks(range(0, 24, 3))
-        fig.tight_layout()
-        self.layout.addWidget(canvas)
+        self._trend['hourly'] = (ax, line, fill)
     
-    def init_quality_section(self):
+    def init_quality_section(self, layout):
+        stats = self._data['quality']
+        labels, sizes = zip(*stats.items()) if stats else ((), ())
+
+        # Eğer hiç veri yoksa ne grafik ne özet oluştur
+        if sum(sizes) == 0:
+            return
+
         # Yatay düzen: Solda Grafik, Sağda Sözel Özet
         container = QWidget()
-        layout = QHBoxLayout(container)
+        row = QHBoxLayout(container)
 
         # 1. Pasta Grafik (Pie Chart)
-        stats = get_focus_quality_stats()
-        labels = list(stats.keys())
-        sizes = list(stats.values())
-
-        # Eğer hiç veri yoksa boş gösterme
-        if sum(sizes) > 0:
-            fig = self._create_figure()
-            canvas = FigureCanvas(fig)
-            ax = fig.add_subplot(111)
-
-            # Renkler: Yeşil (Deep), Sarı (Moderate), Kırmızı (Distracted)
-            colors = ["#175611", "#7e5f1c", "#821628"]
-
-            wedges, texts, autotexts = ax.pie(sizes, labels=labels, autopct='%1.1f%%', 
-                                            startangle=90, colors=colors,
-                                            textprops=dict(color="#C3CDEF"))
-
-            ax.set_title("Odaklanma Kalitesi", color='#cdd6f4', fontsize=12)
-
-            # Pasta grafik arka planı şeffaf olsun
-            fig.patch.set_facecolor('#1e1e2e')
-
-            fig.tight_layout()
-            layout.addWidget(canvas, stretch=2) # Grafik 2 birim yer kaplasın
-
-            # 2. Sözel Analiz (Insight)
-            insight_text = self._generate_insight(stats)
-            lbl_insight = QLabel(insight_text)
-            lbl_insight.setWordWrap(True)
-            lbl_insight.setStyleSheet("""
-                font-size: 14px; 
-                color: #cdd6f4; 
-                background-color: #313244; 
-                padding: 15px; 
-                border-radius: 8px;
-                line-height: 1.5;
-            """)
-            lbl_insight.setAlignment(Qt.AlignTop)
-            layout.addWidget(lbl_insight, stretch=1) # Yazı 1 birim yer kaplasın
-
-        self.layout.addWidget(container)
+        # Renkler: Yeşil (Deep), Sarı (Moderate), Kırmızı (Distracted)
+        colors = [STATS_COLORS['quality_deep'], STATS_COLORS['quality_moderate'], STATS_COLORS['quality_distracted']]
+
+        pie = PieWidget("Odaklanma Kalitesi", text_color=STATS_COLORS['pie_text'])
+        pie.set_data(sizes, colors, labels)
+        row.addWidget(pie, stretch=2) # Grafik 2 birim yer kaplasın
+
+        # 2. Sözel Analiz (Insight)
+        insight_text = self._generate_insight(stats)
+        lbl_insight = QLabel(insight_text)
+        lbl_insight.setWordWrap(True)
+        lbl_insight.setStyleSheet(f"""
+            font-size: 14px; 
+            color: {STATS_COLORS['text']}; 
+            background-color: {STATS_COLORS['surface']}; 
+            padding: 15px; 
+            border-radius: 8px;
+            line-height: 1.5;
+        """)
+        lbl_insight.setAlignment(Qt.AlignTop)
+        row.addWidget(lbl_insight, stretch=1) # Yazı 1 birim yer kaplasın
+
+        layout.addWidget(container)
 
     def _generate_insight(self, stats):
         """Verilere bakarak kullanıcıya özel bir özet metni çıkarır."""
-        deep = stats.get('Deep Work (0 Kesinti)', 0)
-        moderate = stats.get('Moderate (1-2 Kesinti)', 0)
-        distracted = stats.get('Distracted (3+ Kesinti)', 0)
+        deep, moderate, distracted = (stats.get(key, 0) for key in QUALITY_KEYS)
         total = deep + moderate + distracted
 
-        if total == 0: return "Analiz için yeterli veri yok."
-
-        deep_ratio = (deep / total) * 100
-        moderate_ratio = (moderate / total) * 100
-        distracted_ratio = (distracted / total) * 100
-
-        text = "<b>📊 Odaklanma Karnesi</b><br><br>"
+        if total == 0: return INSIGHT_NO_DATA
 
+        inv = 100.0 / total
+        deep_ratio = deep * inv
         if deep_ratio > 70:
-            text += "🚀 <b>Mükemmel Disiplin!</b><br>Oturumlarının büyük çoğunluğu kesintisiz. 'Deep Work' moduna girmekte ustasın.<br><br>"
+            verdict = INSIGHT_DEEP
         elif deep_ratio > 40:
-            text += "⚖️ <b>Dengeli Performans.</b><br>Genellikle iyi odaklanıyorsun ama bazen dikkat dağıtıcılar araya giriyor. Küçük molaları kontrol etmeyi deneyebilirsin.<br><br>"
+            verdict = INSIGHT_MODERATE
         else:
-            text += "⚠️ <b>Dikkat Dağınıklığı Yüksek.</b><br>Çoğu oturumun bölünmüş durumda. Bildirimleri kapatmayı veya ortamını değiştirmeyi dene.<br><br>"
+            verdict = INSIGHT_DISTRACTED
 
-        text += f"• Toplam <b>{total}</b> oturumun <b>{deep}</b> tanesi (%{int(deep_ratio)}) tamamen kesintisizdi.<br>"
+        values = {
+            'total': total,
+            'deep': deep, 'deep_pct': int(deep_ratio),
+            'moderate': moderate, 'moderate_pct': int(moderate * inv),
+            'distracted': distracted, 'distracted_pct': int(distracted * inv),
+        }
+        parts = [INSIGHT_HEADER, verdict, INSIGHT_DEEP_LINE]
         if moderate > 0:
-            text += f"• <b>{moderate}</b> oturum (%{int(moderate_ratio)}) orta düzeyde kesinti yaşadı (1-2 kez).<br>"
+            parts.append(INSIGHT_MODERATE_LINE)
         if distracted > 0:
-            text += f"• <b>{distracted}</b> oturum (%{int(distracted_ratio)}) yüksek kesinti yaşadı (3+ kez). Bu zaman aralıklarını incelemelisin."
-
-        return text
\ No newline at end of file
+            parts.append(INSIGHT_DISTRACTED_LINE)
+        return "".join(parts).format_map(values)
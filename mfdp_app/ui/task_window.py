@@ -1,14 +1,254 @@
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QPushButton, QTreeWidget, QTreeWidgetItem, QFormLayout,
-    QSpinBox, QCheckBox, QColorDialog, QMessageBox, QWidget,
+    QPushButton, QTreeView, QFormLayout,
+    QSpinBox, QCheckBox, QWidget,
     QGroupBox, QComboBox
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QColor
+from PySide6.QtCore import Qt, Signal, QAbstractItemModel, QModelIndex, QTimer
+from PySide6.QtGui import QColor, QShowEvent
 from mfdp_app.core.task_manager import TaskManager
 from mfdp_app.models.data_models import Task
 
+# Tag satırlarının internalId'si; task satırlarında internalId = tag'in sabit id'si + 1
+# (tag satırları kaysa da task index'lerinin parent'ı doğru kalır)
+TAG_NODE = 0
+
+DEFAULT_TAG_COLOR = '#89b4fa'
+ACTIVE_TASK_COLOR = '#a6e3a1'
+
+# Tüm pencere tek stylesheet ile stillenir; widget'lar objectName ile seçilir
+TASK_WINDOW_QSS = """
+QWidget {
+    background-color: #1e1e2e;
+    color: #cdd6f4;
+}
+QLabel#WindowTitle {
+    font-size: 24px;
+    font-weight: bold;
+    color: #a6e3a1;
+    padding: 10px;
+}
+QGroupBox {
+    font-weight: bold;
+    border: 1px solid #45475a;
+    border-radius: 5px;
+    margin-top: 30px;
+    padding-top: 30px;
+}
+QTreeView {
+    background-color: #313244;
+    border: 1px solid #45475a;
+    border-radius: 5px;
+    color: #cdd6f4;
+}
+QTreeView::item {
+    padding: 5px;
+}
+QTreeView::item:selected {
+    background-color: #45475a;
+}
+QLineEdit, QSpinBox, QPushButton#ColorButton {
+    background-color: #313244;
+    border: 1px solid #45475a;
+    border-radius: 5px;
+    padding: 5px;
+}
+QCheckBox {
+    color: #bac2de;
+}
+QPushButton#ActiveButton, QPushButton#SaveButton, QPushButton#DeleteButton {
+    color: #1e1e2e;
+    font-weight: bold;
+}
+QPushButton#ActiveButton {
+    background-color: #89b4fa;
+}
+QPushButton#SaveButton {
+    background-color: #a6e3a1;
+}
+QPushButton#DeleteButton {
+    background-color: #f38ba8;
+}
+QPushButton#SecondaryButton {
+    background-color: #45475a;
+    color: #cdd6f4;
+}
+"""
+
+# "#rrggbb" -> QColor; data() her boyamada çağrıldığı için renkler tekrar parse edilmez
+_COLOR_CACHE = {}
+
+
+def _qcolor(name):
+    color = _COLOR_CACHE.get(name)
+    if color is None:
+        color = _COLOR_CACHE[name] = QColor(name)
+    return color
+
+
+class TaskTreeModel(QAbstractItemModel):
+    """
+    İki seviyeli (tag -> task) model. QTreeWidget gibi her task için item nesnesi
+    oluşturmaz; view sadece görünen satırlar için data() çağırır.
+    """
+    # Sabit renkler sınıf seviyesinde bir kez oluşturulur
+    _ACTIVE_FG = QColor(ACTIVE_TASK_COLOR)
+    _DEFAULT_TAG_FG = QColor(DEFAULT_TAG_COLOR)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tags = []
+        self._by_tag = {}
+        self._tag_colors = {}
+        self._active_id = None
+        self._tag_row = {}  # tag -> tag satırı
+        self._tag_ids = {}  # tag -> sabit id (internalId için)
+        self._id_tags = []  # sabit id -> tag
+        self._pos_by_id = {}  # task_id -> (tag, task satırı)
+
+    def set_tasks(self, tasks_by_tag, tag_colors, active_id):
+        """Tüm veriyi tek seferde değiştir (tek model reset)."""
+        self.beginResetModel()
+        self._tags = list(tasks_by_tag)
+        self._by_tag = tasks_by_tag
+        self._tag_colors = tag_colors
+        self._active_id = active_id
+        self._tag_row = {tag: tag_row for tag_row, tag in enumerate(self._tags)}
+        self._tag_ids = dict(self._tag_row)
+        self._id_tags = list(self._tags)
+        self._pos_by_id = {
+            task.id: (tag, row)
+            for tag in self._tags
+            for row, task in enumerate(tasks_by_tag[tag])
+        }
+        self.endResetModel()
+
+    def add_task(self, task):
+        """
+        Tek task ekle. Task kendi grubunun, grubu da tag listesinin başına girer;
+        tam yenilemedeki sırayla aynı (en yeni task'ın tag'i ilk, created_at DESC).
+        Eklenen task'ın grubunun index'ini döndürür.
+        """
+        tag = task.tag
+        tag_row = self._tag_row.get(tag)
+        if tag_row is None:
+            self.beginInsertRows(QModelIndex(), 0, 0)
+            self._tags.insert(0, tag)
+            self._tag_ids[tag] = len(self._id_tags)
+            self._id_tags.append(tag)
+            self._by_tag[tag] = [task]
+            self._pos_by_id[task.id] = (tag, 0)
+            self._reindex_tags()
+            self.endInsertRows()
+            return self.index(0, 0)
+
+        tasks = self._by_tag[tag]
+        self.beginInsertRows(self.index(tag_row, 0), 0, 0)
+        tasks.insert(0, task)
+        for row, t in enumerate(tasks):
+            self._pos_by_id[t.id] = (tag, row)
+        self.endInsertRows()
+        if tag_row > 0 and self.beginMoveRows(QModelIndex(), tag_row, tag_row, QModelIndex(), 0):
+            self._tags.insert(0, self._tags.pop(tag_row))
+            self._reindex_tags()
+            self.endMoveRows()
+        return self.index(self._tag_row[tag], 0)
+
+    def _reindex_tags(self):
+        self._tag_row = {tag: tag_row for tag_row, tag in enumerate(self._tags)}
+
+    def update_task(self, task):
+        """
+        Tek task'ın satırını güncelle. Task bulunamazsa ya da tag'i değiştiyse
+        False döner; bu durumda çağıran tam yenileme yapmalı.
+        """
+        pos = self._pos_by_id.get(task.id)
+        if pos is None:
+            return False
+        tag, row = pos
+        if tag != task.tag:
+            return False
+        self._by_tag[tag][row] = task
+        index = self.task_index(task.id)
+        self.dataChanged.emit(index, index)
+        return True
+
+    def set_active_id(self, task_id):
+        """Aktif task'ı değiştir; sadece eski ve yeni aktif satır yeniden çizilir."""
+        old_id, self._active_id = self._active_id, task_id
+        for changed_id in (old_id, task_id):
+            index = self.task_index(changed_id)
+            if index.isValid():
+                self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.ForegroundRole])
+
+    def set_tag_color(self, tag, color):
+        """Tag rengini değiştir; sadece tag satırı yeniden çizilir."""
+        self._tag_colors[tag] = color
+        tag_row = self._tag_row.get(tag)
+        if tag_row is not None:
+            index = self.index(tag_row, 0)
+            self.dataChanged.emit(index, index, [Qt.ForegroundRole])
+
+    def task_index(self, task_id):
+        pos = self._pos_by_id.get(task_id)
+        if pos is None:
+            return QModelIndex()
+        tag, row = pos
+        return self.createIndex(row, 0, self._tag_ids[tag] + 1)
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, TAG_NODE)
+        return self.createIndex(row, column, self._tag_ids[self._tags[parent.row()]] + 1)
+
+    def parent(self, index):
+        if not index.isValid() or index.internalId() == TAG_NODE:
+            return QModelIndex()
+        tag = self._id_tags[index.internalId() - 1]
+        return self.createIndex(self._tag_row[tag], 0, TAG_NODE)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._tags)
+        if parent.column() > 0 or parent.internalId() != TAG_NODE:
+            return 0
+        return len(self._by_tag[self._tags[parent.row()]])
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return "Tasklar (Tag'a göre gruplanmış)"
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if index.internalId() == TAG_NODE:
+            tag = self._tags[index.row()]
+            if role == Qt.DisplayRole:
+                return f"🏷️ {tag}"
+            if role == Qt.ForegroundRole:
+                tag_color = self._tag_colors.get(tag)
+                return _qcolor(tag_color) if tag_color else self._DEFAULT_TAG_FG
+            return None  # UserRole: tag item'ı, task değil
+
+        task = self._by_tag[self._id_tags[index.internalId() - 1]][index.row()]
+        is_active = task.id == self._active_id
+        if role == Qt.DisplayRole:
+            duration_text = f" ({task.planned_duration_minutes} dk)" if task.planned_duration_minutes else " (Süresiz)"
+            return f"{'▶' if is_active else '✓'} {task.name}{duration_text}"
+        if role == Qt.ForegroundRole and is_active:
+            # Aktif task'ı vurgula
+            return self._ACTIVE_FG
+        if role == Qt.UserRole:
+            return task.id
+        return None
+
+
 class TaskWindow(QDialog):
     task_selected_signal = Signal(int)  # task_id
     
@@ -16,10 +256,14 @@ class TaskWindow(QDialog):
         super().__init__(parent)
         self.task_manager = task_manager
         self.editing_task_id = None
+        self._tag_colors = {}  # tag adı -> renk, refresh_task_list'te doldurulur
+        self._refresh_pending = False
+        # Pencere gizliyken gelen değişiklikler listeyi kurmaz; showEvent'te bir kez yenilenir
+        self._dirty = True
         
         self.setWindowTitle("Task Yönetimi - MFDP")
         self.resize(700, 600)
-        self.setStyleSheet("background-color: #1e1e2e; color: #cdd6f4;")
+        self.setStyleSheet(TASK_WINDOW_QSS)
         
         # Non-modal yap - arka plandaki pencereyi kullanılabilir tut
         self.setModal(False)
@@ -30,7 +274,7 @@ class TaskWindow(QDialog):
         
         # Başlık
         title = QLabel("Task Yönetimi")
-        title.setStyleSheet("font-size: 24px; font-weight: bold; color: #a6e3a1; padding: 10px;")
+        title.setObjectName("WindowTitle")
         main_layout.addWidget(title)
         
         # Ana içerik: Sol tarafta liste, sağ tarafta form
@@ -38,31 +282,18 @@ class TaskWindow(QDialog):
         
         # Sol: Task Listesi
         list_group = QGroupBox("Tasklar")
-        list_group.setStyleSheet("QGroupBox { font-weight: bold; border: 1px solid #45475a; border-radius: 5px; margin-top: 30px; padding-top: 30px; }")
         list_layout = QVBoxLayout()
         
-        self.task_tree = QTreeWidget()
-        self.task_tree.setHeaderLabel("Tasklar (Tag'a göre gruplanmış)")
-        self.task_tree.setStyleSheet("""
-            QTreeWidget {
-                background-color: #313244;
-                border: 1px solid #45475a;
-                border-radius: 5px;
-                color: #cdd6f4;
-            }
-            QTreeWidget::item {
-                padding: 5px;
-            }
-            QTreeWidget::item:selected {
-                background-color: #45475a;
-            }
-        """)
-        self.task_tree.itemClicked.connect(self.on_task_selected)
+        self.task_model = TaskTreeModel(self)
+        self.task_tree = QTreeView()
+        self.task_tree.setModel(self.task_model)
+        self.task_tree.setUniformRowHeights(True)
+        self.task_tree.clicked.connect(self.on_task_selected)
         list_layout.addWidget(self.task_tree)
         
         # Aktif task butonu
         self.btn_set_active = QPushButton("Aktif Task Olarak Ayarla")
-        self.btn_set_active.setStyleSheet("background-color: #89b4fa; color: #1e1e2e; font-weight: bold;")
+        self.btn_set_active.setObjectName("ActiveButton")
         self.btn_set_active.clicked.connect(self.set_active_task)
         list_layout.addWidget(self.btn_set_active)
         
@@ -71,7 +302,6 @@ class TaskWindow(QDialog):
         
         # Sağ: Task Formu
         form_group = QGroupBox("Task Oluştur/Düzenle")
-        form_group.setStyleSheet("QGroupBox { font-weight: bold; border: 1px solid #45475a; border-radius: 5px; margin-top: 30px; padding-top: 30px; }")
         form_layout = QVBoxLayout()
         
         form = QFormLayout()
@@ -79,18 +309,15 @@ class TaskWindow(QDialog):
         
         self.input_name = QLineEdit()
         self.input_name.setPlaceholderText("Task adı")
-        self.input_name.setStyleSheet("background-color: #313244; border: 1px solid #45475a; border-radius: 5px; padding: 5px;")
         form.addRow("Task Adı:", self.input_name)
         
         self.input_tag = QLineEdit()
         self.input_tag.setPlaceholderText("Tag adı (örn: Ders, İş)")
-        self.input_tag.setStyleSheet("background-color: #313244; border: 1px solid #45475a; border-radius: 5px; padding: 5px;")
         form.addRow("Tag:", self.input_tag)
         
         # Süre seçimi
         duration_layout = QHBoxLayout()
         self.chk_has_duration = QCheckBox("Belirli süre ata")
-        self.chk_has_duration.setStyleSheet("color: #bac2de;")
         self.chk_has_duration.toggled.connect(self.on_duration_toggled)
         duration_layout.addWidget(self.chk_has_duration)
         
@@ -100,14 +327,13 @@ class TaskWindow(QDialog):
         self.input_duration.setValue(25)
         self.input_duration.setSuffix(" dakika")
         self.input_duration.setEnabled(False)
-        self.input_duration.setStyleSheet("background-color: #313244; border: 1px solid #45475a; border-radius: 5px; padding: 5px;")
         duration_layout.addWidget(self.input_duration)
         form.addRow("Süre:", duration_layout)
         
         # Tag renk seçici
         color_layout = QHBoxLayout()
         self.btn_color = QPushButton("Renk Seç")
-        self.btn_color.setStyleSheet("background-color: #313244; border: 1px solid #45475a; border-radius: 5px; padding: 5px;")
+        self.btn_color.setObjectName("ColorButton")
         self.btn_color.clicked.connect(self.select_tag_color)
         self.color_preview = QLabel("")
         self.color_preview.setFixedSize(30, 30)
@@ -124,17 +350,17 @@ class TaskWindow(QDialog):
         btn_layout = QHBoxLayout()
         
         self.btn_save = QPushButton("Kaydet")
-        self.btn_save.setStyleSheet("background-color: #a6e3a1; color: #1e1e2e; font-weight: bold;")
+        self.btn_save.setObjectName("SaveButton")
         self.btn_save.clicked.connect(self.save_task)
         btn_layout.addWidget(self.btn_save)
         
         self.btn_delete = QPushButton("Sil")
-        self.btn_delete.setStyleSheet("background-color: #f38ba8; color: #1e1e2e; font-weight: bold;")
+        self.btn_delete.setObjectName("DeleteButton")
         self.btn_delete.clicked.connect(self.delete_task)
         btn_layout.addWidget(self.btn_delete)
         
         self.btn_clear = QPushButton("Temizle")
-        self.btn_clear.setStyleSheet("background-color: #45475a; color: #cdd6f4;")
+        self.btn_clear.setObjectName("SecondaryButton")
         self.btn_clear.clicked.connect(self.clear_form)
         btn_layout.addWidget(self.btn_clear)
         
@@ -149,19 +375,18 @@ class TaskWindow(QDialog):
         bottom_layout.addStretch()
         
         self.btn_close = QPushButton("Kapat")
-        self.btn_close.setStyleSheet("background-color: #45475a; color: #cdd6f4;")
+        self.btn_close.setObjectName("SecondaryButton")
         self.btn_close.clicked.connect(self.accept)
         bottom_layout.addWidget(self.btn_close)
         
         main_layout.addLayout(bottom_layout)
         
         # TaskManager signal'larını dinle
-        self.task_manager.task_created_signal.connect(self.refresh_task_list)
-        self.task_manager.task_updated_signal.connect(self.refresh_task_list)
+        self.task_manager.task_created_signal.connect(self.on_task_created)
+        self.task_manager.task_updated_signal.connect(self.on_task_updated)
         self.task_manager.active_task_changed_signal.connect(self.on_active_task_changed)
         
-        # İlk yükleme
-        self.refresh_task_list()
+        # İlk yükleme showEvent'te (_dirty başta True)
         self.on_active_task_changed(self.task_manager.get_active_task_id() or -1)
     
     def on_duration_toggled(self, checked):
@@ -170,53 +395,85 @@ class TaskWindow(QDialog):
     
     def select_tag_color(self):
         """Tag rengi seç."""
+        from PySide6.QtWidgets import QColorDialog  # Sadece renk seçilirken gerekir
         color = QColorDialog.getColor()
         if color.isValid():
             self.selected_color = color.name()
             self.color_preview.setStyleSheet(f"background-color: {self.selected_color}; border: 1px solid #45475a; border-radius: 3px;")
     
+    def showEvent(self, event: QShowEvent):
+        """Gizliyken kaçırılan değişiklik varsa listeyi şimdi kur."""
+        super().showEvent(event)
+        if self._dirty:
+            self.refresh_task_list()
+    
+    def _defer_if_hidden(self):
+        """Pencere gizliyse değişikliği işaretle ve True döndür (slot erken çıkar)."""
+        if self.isVisible():
+            return False
+        self._dirty = True
+        return True
+    
+    def _schedule_refresh(self):
+        """
+        Tam yenilemeyi event loop'un sonraki turuna ertele. O anki slot hemen döner,
+        aynı turda gelen birden fazla istek tek yenilemede birleşir.
+        """
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(0, self._maybe_refresh)
+    
+    def _maybe_refresh(self):
+        # Arada doğrudan refresh_task_list çağrıldıysa tekrar yapma
+        if self._refresh_pending:
+            self.refresh_task_list()
+    
     def refresh_task_list(self):
         """Task listesini yenile."""
-        self.task_tree.clear()
-        
-        # Tüm taskları al
-        tasks = self.task_manager.get_all_tasks()
-        
-        # Tag'lara göre grupla
-        tasks_by_tag = {}
-        for task in tasks:
-            if task.tag not in tasks_by_tag:
-                tasks_by_tag[task.tag] = []
-            tasks_by_tag[task.tag].append(task)
-        
-        # Tree widget'a ekle
-        for tag, tag_tasks in tasks_by_tag.items():
-            # Tag için renk al
-            tag_info = next((t for t in self.task_manager.get_all_tags() if t['name'] == tag), None)
-            tag_color = tag_info['color'] if tag_info and tag_info.get('color') else '#89b4fa'
-            
-            # Tag item'ı
-            tag_item = QTreeWidgetItem(self.task_tree)
-            tag_item.setText(0, f"🏷️ {tag}")
-            tag_item.setData(0, Qt.UserRole, None)  # Tag item'ı, task değil
-            tag_item.setExpanded(True)
-            tag_item.setForeground(0, QColor(tag_color))
-            
-            # Task'ları ekle
-            for task in tag_tasks:
-                task_item = QTreeWidgetItem(tag_item)
-                duration_text = f" ({task.planned_duration_minutes} dk)" if task.planned_duration_minutes else " (Süresiz)"
-                task_item.setText(0, f"✓ {task.name}{duration_text}")
-                task_item.setData(0, Qt.UserRole, task.id)
-                
-                # Aktif task'ı vurgula
-                if self.task_manager.get_active_task_id() == task.id:
-                    task_item.setForeground(0, QColor("#a6e3a1"))
-                    task_item.setText(0, f"▶ {task.name}{duration_text}")
+        self._refresh_pending = False
+        self._dirty = False
+        # Tag renkleri bir kez alınır, model ve form aynı dict'i kullanır
+        tag_colors = self._tag_colors = {t['name']: t.get('color') for t in self.task_manager.get_all_tags()}
+        
+        # Tag'lara göre gruplanmış tasklar TaskManager'da hazır tutulur
+        tasks_by_tag = self.task_manager.get_tasks_grouped()
+        
+        # Reset + expandAll tek boyamada birleşsin
+        self.task_tree.setUpdatesEnabled(False)
+        self.task_tree.blockSignals(True)
+        try:
+            # Model tek reset ile güncellenir; satırlar view tarafından görünür oldukça çizilir
+            self.task_model.set_tasks(tasks_by_tag, tag_colors, self.task_manager.get_active_task_id())
+            self.task_tree.expandAll()
+        finally:
+            self.task_tree.blockSignals(False)
+            self.task_tree.setUpdatesEnabled(True)
+            self.task_tree.viewport().update()
     
-    def on_task_selected(self, item, column):
+    def on_task_created(self, task_id):
+        """Yeni task'ı tüm listeyi yeniden kurmadan ekle."""
+        if self._defer_if_hidden():
+            return
+        task = self.task_manager.get_task_by_id(task_id)
+        if not task:
+            return
+        if task.tag not in self._tag_colors:
+            self._tag_colors[task.tag] = task.color
+        self.task_tree.expand(self.task_model.add_task(task))
+    
+    def on_task_updated(self, task_id):
+        """Güncellenen task'ın sadece kendi satırını yenile."""
+        if self._defer_if_hidden():
+            return
+        task = self.task_manager.get_task_by_id(task_id)
+        if not task or not self.task_model.update_task(task):
+            # Tag değişti ya da task listede yok: gruplar yeniden kurulmalı
+            self._schedule_refresh()
+    
+    def on_task_selected(self, index):
         """Task seçildiğinde formu doldur."""
-        task_id = item.data(0, Qt.UserRole)
+        task_id = index.data(Qt.UserRole)
         if task_id is None:
             return  # Tag item'ı seçilmiş
         
@@ -235,9 +492,9 @@ class TaskWindow(QDialog):
             self.chk_has_duration.setChecked(False)
         
         # Renk
-        tag_info = next((t for t in self.task_manager.get_all_tags() if t['name'] == task.tag), None)
-        if tag_info and tag_info.get('color'):
-            self.selected_color = tag_info['color']
+        tag_color = self._tag_colors.get(task.tag)
+        if tag_color:
+            self.selected_color = tag_color
             self.color_preview.setStyleSheet(f"background-color: {self.selected_color}; border: 1px solid #45475a; border-radius: 3px;")
         else:
             self.selected_color = None
@@ -245,6 +502,7 @@ class TaskWindow(QDialog):
     
     def save_task(self):
         """Task kaydet."""
+        from PySide6.QtWidgets import QMessageBox
         name = self.input_name.text().strip()
         tag = self.input_tag.text().strip()
         
@@ -266,18 +524,21 @@ class TaskWindow(QDialog):
             )
             if success and self.selected_color:
                 self.task_manager.assign_color_to_tag(tag, self.selected_color)
+                self.task_model.set_tag_color(tag, self.selected_color)
         else:
             # Yeni oluştur
             task_id = self.task_manager.create_task(name, tag, planned_duration, self.selected_color)
             if task_id:
                 if self.selected_color:
                     self.task_manager.assign_color_to_tag(tag, self.selected_color)
+                    self.task_model.set_tag_color(tag, self.selected_color)
         
+        # Liste task_created/task_updated sinyalleriyle zaten güncellendi
         self.clear_form()
-        self.refresh_task_list()
     
     def delete_task(self):
         """Task sil."""
+        from PySide6.QtWidgets import QMessageBox
         if not self.editing_task_id:
             QMessageBox.warning(self, "Uyarı", "Önce bir task seçin!")
             return
@@ -290,24 +551,23 @@ class TaskWindow(QDialog):
         if reply == QMessageBox.Yes:
             self.task_manager.delete_task(self.editing_task_id)
             self.clear_form()
-            self.refresh_task_list()
+            self._schedule_refresh()
     
     def set_active_task(self):
         """Seçili task'ı aktif yap."""
-        selected_items = self.task_tree.selectedItems()
-        if not selected_items:
+        from PySide6.QtWidgets import QMessageBox
+        selected_indexes = self.task_tree.selectionModel().selectedIndexes()
+        if not selected_indexes:
             QMessageBox.warning(self, "Uyarı", "Önce bir task seçin!")
             return
         
-        item = selected_items[0]
-        task_id = item.data(0, Qt.UserRole)
+        task_id = selected_indexes[0].data(Qt.UserRole)
         if task_id is None:
             QMessageBox.warning(self, "Uyarı", "Lütfen bir task seçin, tag değil!")
             return
         
         self.task_manager.set_active_task(task_id)
         self.task_selected_signal.emit(task_id)
-        self.refresh_task_list()
     
     def on_active_task_changed(self, task_id):
         """Aktif task değiştiğinde."""
@@ -317,7 +577,9 @@ class TaskWindow(QDialog):
             task = self.task_manager.get_task_by_id(task_id)
             if task:
                 self.btn_set_active.setText(f"Aktif: {task.name}")
-        self.refresh_task_list()
+        if self._defer_if_hidden():
+            return
+        self.task_model.set_active_id(None if task_id == -1 else task_id)
     
     def clear_form(self):
         """Formu temizle."""
@@ -1,12 +1,43 @@
 import sqlite3
 import datetime
-import random
+import numpy as np
 
 DB_NAME = 'focus_tracker.db'
 
+MODES = np.array(['Focus', 'Short Break', 'Long Break'])
+PLANNED_MINUTES = np.array([25, 5, 15])  # MODES ile aynı sırada
+INTERRUPTION_TYPES = np.array(['pause', 'reset', 'mode_change'])
+
+# INSERT cümleleri tek yerde; sqlite3 statement cache'i her çağrıda aynı SQL'i görür
+SQL_INSERT_TASK = """
+    INSERT INTO tasks (name, tag, planned_duration_minutes, created_at, color, is_active)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+SQL_INSERT_TAG = """
+    INSERT INTO tags (name, color, created_at)
+    VALUES (?, ?, ?)
+"""
+SQL_INSERT_SESSION = """
+    INSERT INTO sessions_v2 (
+        start_time, end_time, duration_seconds,
+        planned_duration_minutes, mode, completed,
+        task_name, category, interruption_count
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+SQL_INSERT_INTERRUPTION = """
+    INSERT INTO interruptions (
+        session_id, seconds_into_session,
+        interruption_time, interruption_type
+    ) VALUES (?, ?, ?, ?)
+"""
+
 def create_connection():
     return sqlite3.connect(DB_NAME)
 
+def format_times(times):
+    """datetime64 dizisini tek seferde 'YYYY-MM-DD HH:MM:SS' string listesine çevir."""
+    return np.char.replace(np.datetime_as_string(times, unit='s'), 'T', ' ').tolist()
+
 def seed_database():
     """
     Yeni timer yapısına (FocusSession + PmdrCountdownTimer) uygun test verisi oluşturur.
@@ -15,8 +46,18 @@ def seed_database():
     - active_seconds (duraklatmalar hariç) kullanır
     - Interruptions tablosuna veri ekler (eğer varsa)
     """
+    rng = np.random.default_rng()
     conn = create_connection()
+    # Tohumlama tek seferlik toplu yazma; journal'ı diske yazmaya gerek yok
+    conn.executescript("""
+        PRAGMA journal_mode=MEMORY;
+        PRAGMA synchronous=OFF;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-200000;
+    """)
     cursor = conn.cursor()
+    # Tüm tohumlama tek transaction'da yapılır; commit en sonda
+    cursor.execute("BEGIN")
     
     print("🌱 Veritabanı tohumlanıyor (Yeni Timer Yapısına Uygun)...")
     
@@ -25,20 +66,14 @@ def seed_database():
     cursor.execute("DELETE FROM tasks")
     cursor.execute("DELETE FROM tags")
     
-    # Interruptions tablosu var mı kontrol et ve temizle
-    cursor.execute("""
-        SELECT name FROM sqlite_master 
-        WHERE type='table' AND name='interruptions'
-    """)
-    interruptions_table_exists = cursor.fetchone() is not None
-    
-    if interruptions_table_exists:
-        try:
-            cursor.execute("DELETE FROM interruptions")
-        except sqlite3.OperationalError:
-            pass  # Tablo yoksa hata verme
+    # Interruptions tablosu varsa temizle; DELETE'in başarısı tablonun varlığını da gösterir
+    # (ayrı bir sqlite_master sorgusuna gerek yok, bayrak bir kez belirlenir)
+    try:
+        cursor.execute("DELETE FROM interruptions")
+        interruptions_table_exists = True
+    except sqlite3.OperationalError:
+        interruptions_table_exists = False  # Tablo henüz oluşturulmamış
     
-    conn.commit()
     print("🧹 Eski veriler temizlendi.")
     
     # Task'lar ve Tag'ler oluştur
@@ -57,17 +92,17 @@ def seed_database():
     ]
     
     created_tasks = []
-    for task_data in tasks_data:
-        created_at = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    planned_durations = rng.choice([25, 50, 90], size=len(tasks_data)).tolist()  # Planlanan süre
+    # Tüm task'lar aynı anda oluşturulmuş sayılır
+    created_at = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    known_tags = set()  # tags tablosu başta temizlendi; eklenenler burada izlenir
+    for task_data, planned_duration in zip(tasks_data, planned_durations):
         try:
             # Task ekle
-            cursor.execute("""
-                INSERT INTO tasks (name, tag, planned_duration_minutes, created_at, color, is_active)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
+            cursor.execute(SQL_INSERT_TASK, (
                 task_data["name"],
                 task_data["tag"],
-                random.choice([25, 50, 90]),  # Planlanan süre
+                planned_duration,
                 created_at,
                 task_data["color"],
                 1
@@ -75,12 +110,9 @@ def seed_database():
             task_id = cursor.lastrowid
             
             # Tag ekle (yoksa)
-            cursor.execute("SELECT name FROM tags WHERE name = ?", (task_data["tag"],))
-            if not cursor.fetchone():
-                cursor.execute("""
-                    INSERT INTO tags (name, color, created_at)
-                    VALUES (?, ?, ?)
-                """, (task_data["tag"], task_data["color"], created_at))
+            if task_data["tag"] not in known_tags:
+                known_tags.add(task_data["tag"])
+                cursor.execute(SQL_INSERT_TAG, (task_data["tag"], task_data["color"], created_at))
             
             created_tasks.append({
                 "id": task_id,
@@ -90,157 +122,131 @@ def seed_database():
         except sqlite3.IntegrityError:
             pass  # Duplicate task
     
-    conn.commit()
     print(f"✅ {len(created_tasks)} task oluşturuldu.")
     
     # Son 14 gün için session verileri oluştur
+    # Tüm rastgele değerler gün/session döngüsü yerine tek seferde dizi olarak üretilir
     print("📊 Session verileri oluşturuluyor...")
-    modes = ['Focus'] * 8 + ['Short Break'] * 3 + ['Long Break'] * 1
+    days = 14
+    mode_pool = np.array([0] * 8 + [1] * 3 + [2] * 1)  # MODES indeksleri
+    
+    start_date = np.datetime64(datetime.date.today() - datetime.timedelta(days=days), 'D')
+    day_dates = start_date + np.arange(days)
+    
+    # Hafta sonları daha az session (1970-01-01 Perşembe -> weekday = (gün + 3) % 7)
+    weekend = (day_dates.astype(np.int64) + 3) % 7 >= 5
+    num_sessions = np.where(weekend, rng.integers(0, 5, size=days), rng.integers(3, 13, size=days))
+    total = int(num_sessions.sum())
+    day_index = np.repeat(np.arange(days), num_sessions)
+    
+    # Saati her session'da ileri sar: gün içi kümülatif toplam, 9'dan başlar, 24'te başa döner
+    steps = np.cumsum(rng.uniform(0.5, 2.5, size=total))
+    day_offsets = np.concatenate(([0.0], steps))[np.cumsum(num_sessions) - num_sessions]
+    start_hour = (9.0 + steps - np.repeat(day_offsets, num_sessions)) % 24
+    
+    start_offsets = (
+        start_hour.astype(np.int64) * 3600
+        + rng.integers(0, 60, size=total) * 60
+        + rng.integers(0, 60, size=total)
+    )
+    session_start = day_dates[day_index].astype('datetime64[s]') + start_offsets.astype('timedelta64[s]')
+    
+    # Mod seçimi ve planlanan süre
+    mode_idx = rng.choice(mode_pool, size=total)
+    is_focus = mode_idx == 0
+    planned_minutes = PLANNED_MINUTES[mode_idx]
+    
+    # Tamamlandı mı? (%75 ihtimalle evet)
+    completed = rng.random(total) > 0.25
+    
+    # Gerçekleşen süre (active_seconds - duraklatmalar hariç)
+    # Tamamlandıysa planlanan süre kadar, yarım kaldıysa 2-20 dakika arası
+    active_seconds = np.where(
+        completed,
+        planned_minutes * 60,
+        rng.integers(2 * 60, np.minimum(20 * 60, (planned_minutes - 2) * 60) + 1)
+    )
+    
+    # Duraklatma süreleri: Focus'ta %40 ihtimalle 1-3 duraklatma, her biri 30 sn - 5 dk
+    pause_count = np.where((rng.random(total) < 0.4) & is_focus, rng.integers(1, 4, size=total), 0)
+    pause_draws = rng.integers(30, 5 * 60 + 1, size=(total, 3))
+    pause_seconds = (pause_draws * (np.arange(3) < pause_count[:, None])).sum(axis=1)
+    
+    # Session bitiş zamanı (aktif süre + duraklatma süresi)
+    session_end = session_start + (active_seconds + pause_seconds).astype('timedelta64[s]')
+    
+    # Task seçimi (Focus modunda %80 ihtimalle task var)
+    task_names = np.full(total, None, dtype=object)
+    categories = np.full(total, None, dtype=object)
+    if created_tasks:
+        has_task = is_focus & (rng.random(total) < 0.8)
+        picked = rng.integers(0, len(created_tasks), size=total)[has_task]
+        task_names[has_task] = np.array([t["name"] for t in created_tasks], dtype=object)[picked]
+        categories[has_task] = np.array([t["tag"] for t in created_tasks], dtype=object)[picked]
+    
+    # Kesinti sayısı (Focus session'larında 0-4 arası)
+    interruption_count = np.where(is_focus & (active_seconds > 0), rng.integers(0, 5, size=total), 0)
+    
+    # Satırlar iterator olarak kalır; executemany onları tek tek tüketir, ara liste kurulmaz
+    sessions_rows = zip(
+        format_times(session_start),
+        format_times(session_end),
+        active_seconds.tolist(),  # active_seconds kullanıyoruz (duraklatmalar hariç)
+        planned_minutes.tolist(),
+        MODES[mode_idx].tolist(),
+        completed.astype(int).tolist(),
+        task_names.tolist(),
+        categories.tolist(),
+        interruption_count.tolist()
+    )
     
-    start_date = datetime.datetime.now() - datetime.timedelta(days=14)
-    total_sessions = 0
+    # Interruptions tablosuna eklenecekler (eğer varsa): (session sırası, saniye, zaman, tip)
     total_interruptions = 0
+    if interruptions_table_exists:
+        owner = np.repeat(np.arange(total), interruption_count)
+        owner_active = active_seconds[owner]
+        # Pattern: 35-45 dakika arası daha fazla kesinti (session yeterince uzunsa %30 ihtimalle)
+        in_window = (owner_active >= 35 * 60) & (rng.random(owner.size) < 0.3)
+        window_high = np.minimum(45 * 60, np.maximum(owner_active, 35 * 60)) + 1
+        seconds_into = np.where(
+            in_window,
+            rng.integers(35 * 60, window_high),
+            rng.integers(0, owner_active + 1)  # Normal dağılım (tüm session boyunca)
+        )
+        interruption_time = session_start[owner] + seconds_into.astype('timedelta64[s]')
+        interruptions_rows = zip(
+            owner.tolist(),
+            seconds_into.tolist(),
+            format_times(interruption_time),
+            rng.choice(INTERRUPTION_TYPES, size=owner.size).tolist()
+        )
+        total_interruptions = int(owner.size)
     
-    for day_offset in range(14):
-        current_day = start_date + datetime.timedelta(days=day_offset)
-        
-        # Hafta sonları daha az session
-        if current_day.weekday() >= 5:
-            num_sessions = random.randint(0, 4)
-        else:
-            num_sessions = random.randint(3, 12)
-        
-        start_hour = 9.0
-        
-        for session_num in range(num_sessions):
-            # Saati ileri sar
-            start_hour += random.uniform(0.5, 2.5)
-            if start_hour >= 24:
-                start_hour -= 24
-            
-            minute = random.randint(0, 59)
-            second = random.randint(0, 59)
-            
-            session_start = current_day.replace(
-                hour=int(start_hour),
-                minute=minute,
-                second=second
-            )
-            
-            # Mod seçimi
-            mode = random.choice(modes)
-            
-            # Planlanan süre
-            planned_minutes = 25
-            if mode == 'Short Break':
-                planned_minutes = 5
-            elif mode == 'Long Break':
-                planned_minutes = 15
-            
-            # Tamamlandı mı? (%75 ihtimalle evet)
-            completed = 1 if random.random() > 0.25 else 0
-            
-            # Gerçekleşen süre (active_seconds - duraklatmalar hariç)
-            if completed:
-                # Tamamlandıysa, planlanan süre kadar çalışıldı
-                active_seconds = planned_minutes * 60
-            else:
-                # Yarım kaldıysa, 2-20 dakika arası
-                active_seconds = random.randint(2 * 60, min(20 * 60, (planned_minutes - 2) * 60))
-            
-            # Duraklatma süreleri (pause_seconds)
-            # %40 ihtimalle duraklatma var
-            pause_seconds = 0
-            pause_count = 0
-            if random.random() < 0.4 and mode == 'Focus':
-                pause_count = random.randint(1, 3)
-                # Her duraklatma 30 saniye ile 5 dakika arası
-                pause_seconds = sum([random.randint(30, 5 * 60) for _ in range(pause_count)])
-            
-            # Toplam süre = aktif süre + duraklatma süresi
-            total_seconds = active_seconds + pause_seconds
-            
-            # Session bitiş zamanı
-            session_end = session_start + datetime.timedelta(seconds=total_seconds)
-            
-            # Task seçimi (Focus modunda %80 ihtimalle task var)
-            task_name = None
-            category = None
-            if mode == 'Focus' and random.random() < 0.8 and created_tasks:
-                selected_task = random.choice(created_tasks)
-                task_name = selected_task["name"]
-                category = selected_task["tag"]
-            
-            # Interruption pattern'leri oluştur
-            # 35-45 dakika arası daha fazla kesinti (pattern)
-            interruption_count = 0
-            interruption_seconds = []
-            interruption_times = []
-            interruption_types = []
-            
-            if mode == 'Focus' and active_seconds > 0:
-                # Kesinti sayısı (0-4 arası)
-                interruption_count = random.randint(0, 4)
-                
-                # Eğer kesinti varsa, zamanlarını belirle
-                for i in range(interruption_count):
-                    # Session içindeki saniye (0 ile active_seconds arası)
-                    # Pattern: 35-45 dakika arası daha fazla kesinti (eğer session yeterince uzunsa)
-                    if active_seconds >= 35 * 60 and random.random() < 0.3:  # %30 ihtimalle 35-45 dk arası
-                        # 35-45 dakika arası (ama active_seconds'ı geçmemeli)
-                        max_seconds = min(45 * 60, active_seconds)
-                        seconds_into = random.randint(35 * 60, max_seconds)
-                    else:
-                        # Normal dağılım (tüm session boyunca)
-                        seconds_into = random.randint(0, active_seconds)
-                    
-                    interruption_seconds.append(seconds_into)
-                    
-                    # Kesinti zamanı
-                    interruption_time = session_start + datetime.timedelta(seconds=seconds_into)
-                    interruption_times.append(interruption_time)
-                    
-                    # Kesinti tipi
-                    interruption_types.append(random.choice(['pause', 'reset', 'mode_change']))
-            
-            # Session'ı veritabanına ekle
-            cursor.execute("""
-                INSERT INTO sessions_v2 (
-                    start_time, end_time, duration_seconds,
-                    planned_duration_minutes, mode, completed,
-                    task_name, category, interruption_count
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                session_start.strftime('%Y-%m-%d %H:%M:%S'),
-                session_end.strftime('%Y-%m-%d %H:%M:%S'),
-                active_seconds,  # active_seconds kullanıyoruz (duraklatmalar hariç)
-                planned_minutes,
-                mode,
-                completed,
-                task_name,
-                category,
-                interruption_count
-            ))
-            
-            session_id = cursor.lastrowid
-            
-            # Interruptions tablosuna ekle (eğer varsa)
-            if interruptions_table_exists and interruption_count > 0:
-                for sec, time, itype in zip(interruption_seconds, interruption_times, interruption_types):
-                    cursor.execute("""
-                        INSERT INTO interruptions (
-                            session_id, seconds_into_session,
-                            interruption_time, interruption_type
-                        ) VALUES (?, ?, ?, ?)
-                    """, (
-                        session_id,
-                        sec,
-                        time.strftime('%Y-%m-%d %H:%M:%S'),
-                        itype
-                    ))
-                    total_interruptions += 1
-            
-            total_sessions += 1
+    # Toplu yazma boyunca indeksler satır satır güncellenmesin: şemadaki DDL'leri sakla,
+    # indeksleri düşür ve sonda son veri üzerinde bir kez yeniden kur
+    cursor.execute("""
+        SELECT name, sql FROM sqlite_master
+        WHERE type='index' AND tbl_name IN ('sessions_v2', 'interruptions') AND sql IS NOT NULL
+    """)
+    saved_indexes = cursor.fetchall()
+    for index_name, _ in saved_indexes:
+        cursor.execute(f'DROP INDEX "{index_name}"')
+    
+    # Session'ları veritabanına ekle
+    cursor.executemany(SQL_INSERT_SESSION, sessions_rows)
+    total_sessions = total
+    
+    if total_interruptions:
+        # Tablo başta temizlendi; id'ler ekleme sırasıyla session'lara karşılık gelir
+        cursor.execute("SELECT id FROM sessions_v2 ORDER BY id")
+        session_ids = [row[0] for row in cursor.fetchall()]
+        cursor.executemany(SQL_INSERT_INTERRUPTION, (
+            (session_ids[index], sec, time, itype) for index, sec, time, itype in interruptions_rows
+        ))
+    
+    # İndeksleri son veri üzerinde tek seferde kur
+    for _, index_sql in saved_indexes:
+        cursor.execute(index_sql)
     
     conn.commit()
     conn.close()